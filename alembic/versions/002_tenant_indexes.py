@@ -0,0 +1,42 @@
+"""tenant scoped indexes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_contacts_organization_id_created_at', 'contacts', ['organization_id', 'created_at']),
+    ('ix_deals_organization_id_stage', 'deals', ['organization_id', 'stage']),
+    ('ix_deals_organization_id_created_at', 'deals', ['organization_id', 'created_at']),
+    ('ix_tasks_organization_id_assigned_to_id', 'tasks', ['organization_id', 'assigned_to_id']),
+    ('ix_tasks_organization_id_created_at', 'tasks', ['organization_id', 'created_at']),
+    ('ix_activities_organization_id_created_at', 'activities', ['organization_id', sa.text('created_at DESC')]),
+    ('ix_activities_organization_id_deal_id_created_at', 'activities',
+     ['organization_id', 'deal_id', sa.text('created_at DESC')]),
+    ('ix_organization_members_user_id', 'organization_members', ['user_id']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
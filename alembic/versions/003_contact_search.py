@@ -0,0 +1,41 @@
+"""contact full-text search index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-02-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(name, '') || ' ' || replace(coalesce(email, ''), '@', ' ') || ' ' || "
+    "coalesce(phone, '') || ' ' || coalesce(company, ''))"
+)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_contacts_search_vector',
+            'contacts',
+            [sa.text(SEARCH_VECTOR)],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_contacts_search_vector', table_name='contacts', postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""list filter indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-03-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_deals_organization_id_status', 'deals', ['organization_id', 'status']),
+    ('ix_deals_organization_id_contact_id', 'deals', ['organization_id', 'contact_id']),
+    ('ix_tasks_organization_id_status', 'tasks', ['organization_id', 'status']),
+    ('ix_tasks_organization_id_due_date', 'tasks', ['organization_id', 'due_date']),
+    ('ix_tasks_organization_id_deal_id', 'tasks', ['organization_id', 'deal_id']),
+    ('ix_contacts_organization_id_company', 'contacts', ['organization_id', 'company']),
+    ('ix_activities_organization_id_type', 'activities', ['organization_id', 'type']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,41 @@
+"""deal stats rollup
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'deal_stats',
+        sa.Column('organization_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('stage', sa.String(length=100), nullable=False),
+        sa.Column('status', sa.String(length=50), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('valued_count', sa.Integer(), nullable=False),
+        sa.Column('total_value', sa.Numeric(precision=18, scale=2), nullable=False),
+        sa.ForeignKeyConstraint(['organization_id'], ['organizations.id'], ),
+        sa.PrimaryKeyConstraint('organization_id', 'stage', 'status')
+    )
+    op.execute(
+        "INSERT INTO deal_stats (organization_id, stage, status, count, valued_count, total_value) "
+        "SELECT organization_id, stage, status, count(id), count(value), coalesce(sum(value), 0) "
+        "FROM deals GROUP BY organization_id, stage, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('deal_stats')
@@ -0,0 +1,41 @@
+"""structured deal stage transitions on activities
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-04-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('activities', sa.Column('from_stage', sa.String(length=100), nullable=True))
+    op.add_column('activities', sa.Column('to_stage', sa.String(length=100), nullable=True))
+    op.execute(
+        "UPDATE activities SET "
+        "from_stage = substring(description from '^deal stage changed from (.*) to .*$'), "
+        "to_stage = substring(description from '^deal stage changed from .* to (.*)$') "
+        "WHERE type = 'deal_stage_changed'"
+    )
+    op.execute(
+        "UPDATE activities SET to_stage = coalesce("
+        "(SELECT changed.from_stage FROM activities AS changed "
+        "WHERE changed.deal_id = activities.deal_id AND changed.type = 'deal_stage_changed' "
+        "ORDER BY changed.created_at LIMIT 1), "
+        "(SELECT deals.stage FROM deals WHERE deals.id = activities.deal_id)) "
+        "WHERE type = 'deal_created'"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('activities', 'to_stage')
+    op.drop_column('activities', 'from_stage')
@@ -0,0 +1,46 @@
+"""open task due date indexes
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-04-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('overdue_notified_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute("UPDATE tasks SET overdue_notified_at = now() WHERE status != 'completed' AND due_date < now()")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_organization_id_open_due_date',
+            'tasks',
+            ['organization_id', 'due_date'],
+            unique=False,
+            postgresql_where=sa.text("status != 'completed'"),
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_tasks_overdue_unnotified',
+            'tasks',
+            ['due_date'],
+            unique=False,
+            postgresql_where=sa.text("status != 'completed' AND overdue_notified_at IS NULL"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tasks_overdue_unnotified', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_organization_id_open_due_date', table_name='tasks', postgresql_concurrently=True)
+    op.drop_column('tasks', 'overdue_notified_at')
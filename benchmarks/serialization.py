@@ -0,0 +1,84 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List
+from uuid import uuid4
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.api.serialization import serialize_list
+from src.api.v1.schemas import ContactListItem, DealListItem, TaskResponse, ActivityResponse
+from src.models import *
+
+PAGE_SIZE = 100
+ROUNDS = 200
+
+
+def make_rows(model, count=PAGE_SIZE):
+    now = datetime.now(timezone.utc)
+    organization_id = uuid4()
+    common = {"organization_id": organization_id, "created_at": now}
+    if model is Contact:
+        return [
+            Contact(id=uuid4(), name=f"contact {i}", email=f"c{i}@example.com", phone="555", company="acme",
+                    notes="note " * 20, updated_at=now, **common)
+            for i in range(count)
+        ]
+    if model is Deal:
+        return [
+            Deal(id=uuid4(), contact_id=uuid4(), title=f"deal {i}", value=Decimal("1000.50"), stage="new",
+                 status="open", notes="note " * 20, updated_at=now, closed_at=None, **common)
+            for i in range(count)
+        ]
+    if model is Task:
+        return [
+            Task(id=uuid4(), deal_id=None, contact_id=None, assigned_to_id=uuid4(), title=f"task {i}",
+                 description="call", status="pending", due_date=now, updated_at=now, completed_at=None, **common)
+            for i in range(count)
+        ]
+    return [
+        Activity(id=uuid4(), user_id=uuid4(), deal_id=uuid4(), contact_id=None, task_id=None,
+                 type="deal_stage_changed", description="deal stage changed", from_stage="new",
+                 to_stage="proposal", **common)
+        for i in range(count)
+    ]
+
+
+async def default_path(schema, rows) -> bytes:
+    field = create_response_field(name="Response", type_=List[schema])
+    content = await serialize_response(field=field, response_content=rows)
+    return JSONResponse(content).body
+
+
+async def fast_path(schema, rows) -> bytes:
+    return serialize_list(schema, rows)
+
+
+async def rows_per_second(serialize, schema, rows) -> float:
+    await serialize(schema, rows)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await serialize(schema, rows)
+    return ROUNDS * len(rows) / (time.perf_counter() - start)
+
+
+LIST_ENDPOINTS = [
+    ("/contacts", ContactListItem, Contact),
+    ("/deals", DealListItem, Deal),
+    ("/tasks", TaskResponse, Task),
+    ("/activities", ActivityResponse, Activity),
+]
+
+
+async def main() -> None:
+    for endpoint, schema, model in LIST_ENDPOINTS:
+        rows = make_rows(model)
+        before = await rows_per_second(default_path, schema, rows)
+        after = await rows_per_second(fast_path, schema, rows)
+        print(f"{endpoint}: {before:,.0f} -> {after:,.0f} rows/s ({after / before:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
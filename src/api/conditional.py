@@ -0,0 +1,57 @@
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import UUID
+from fastapi import Depends, Request, Response
+
+from src.config import app_settings
+from src.cache import analytics_cache
+from src.api.dependencies import get_request_context
+from src.repositories.base_repository import BaseRepository
+from src.services.request_context import RequestContext
+
+
+def make_etag(*parts) -> str:
+    return '"' + hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest() + '"'
+
+
+def entity_etag(id: UUID, updated_at: datetime) -> str:
+    return make_etag(id, updated_at.isoformat())
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def check_etag(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    if etag is None:
+        return None
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+async def check_entity_etag(request: Request, response: Response, repo: BaseRepository,
+                            organization_id: UUID, id: UUID) -> Optional[Response]:
+    if "if-none-match" not in request.headers:
+        return None
+    updated_at = await repo.get_updated_at(organization_id, id)
+    if updated_at is None:
+        return None
+    return check_etag(request, response, entity_etag(id, updated_at))
+
+
+async def get_version_etag(
+    request: Request,
+    context: RequestContext = Depends(get_request_context)
+) -> Optional[str]:
+    if not (app_settings.cache_url or app_settings.local_version_etags):
+        return None
+    version = await analytics_cache.get_version(context.organization_id, "data")
+    today = datetime.now(timezone.utc).date()
+    return make_etag(request.url.path, request.url.query, context.organization_id, version, today)
@@ -1,32 +1,42 @@
+import secrets
 from typing import Optional
 from uuid import UUID
-from fastapi import Header, HTTPException, Depends
+from fastapi import Header, HTTPException, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.config import app_settings
 from src.database import get_db
 from src.services.auth_service import AuthService
 from src.services.organization_service import OrganizationService
-from src.models.user import User
 from src.models.organization_member import OrganizationMember
+from src.services.request_context import CurrentUser, RequestContext
+from src.repositories.base_repository import Cursor, decode_cursor
 
 
 async def get_current_user(
     authorization: str = Header(...),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> CurrentUser:
     if not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="invalid token format")
     token = authorization.split(" ")[1]
     auth_service = AuthService(db)
-    payload = auth_service.decode_token(token)
+    if app_settings.auth_cache_enabled:
+        payload = auth_service.decode_token_cached(token)
+    else:
+        payload = auth_service.decode_token(token)
     if not payload:
         raise HTTPException(status_code=401, detail="invalid token")
     user_id = payload.get("sub")
     if not user_id:
         raise HTTPException(status_code=401, detail="invalid token")
-    from src.repositories.user_repository import UserRepository
-    user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(UUID(user_id))
+    if app_settings.auth_cache_enabled:
+        user = await auth_service.get_user_cached(UUID(user_id))
+    else:
+        from src.repositories.user_repository import UserRepository
+        user_repo = UserRepository(db)
+        model = await user_repo.get_by_id(UUID(user_id))
+        user = CurrentUser.from_model(model) if model else None
     if not user:
         raise HTTPException(status_code=401, detail="user not found")
     return user
@@ -45,7 +55,7 @@ async def get_organization_id(
 
 async def get_organization_member(
     organization_id: UUID = Depends(get_organization_id),
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> OrganizationMember:
     org_service = OrganizationService(db)
@@ -54,3 +64,27 @@ async def get_organization_member(
         raise HTTPException(status_code=403, detail="access denied")
     return member
 
+
+
+async def get_request_context(
+    current_user: CurrentUser = Depends(get_current_user),
+    member: OrganizationMember = Depends(get_organization_member)
+) -> RequestContext:
+    return RequestContext(user=current_user, member=member)
+
+
+async def require_internal_token(authorization: Optional[str] = Header(None)) -> None:
+    if not app_settings.internal_token:
+        raise HTTPException(status_code=404, detail="not found")
+    expected = f"Bearer {app_settings.internal_token}"
+    if not authorization or not secrets.compare_digest(authorization.encode(), expected.encode()):
+        raise HTTPException(status_code=401, detail="invalid internal token")
+
+
+async def get_cursor(cursor: Optional[str] = Query(None)) -> Optional[Cursor]:
+    if cursor is None:
+        return None
+    try:
+        return decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
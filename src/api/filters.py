@@ -0,0 +1,90 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional, Type
+from uuid import UUID
+from fastapi import Depends, HTTPException, Query
+
+from src.api.dependencies import get_cursor
+from src.repositories.base_repository import BaseRepository, Cursor
+
+
+def sort_param(repository: Type[BaseRepository]):
+    pattern = "^-?(" + "|".join(repository.sort_fields) + ")$"
+
+    async def get_sort(
+        sort: Optional[str] = Query(None, pattern=pattern),
+        cursor: Optional[Cursor] = Depends(get_cursor)
+    ) -> Optional[str]:
+        if sort is not None and cursor is not None:
+            raise HTTPException(status_code=400, detail="cursor pagination does not support custom sort")
+        return sort
+
+    return get_sort
+
+
+async def get_created_range(
+    created_after: Optional[datetime] = Query(None),
+    created_before: Optional[datetime] = Query(None)
+) -> dict:
+    return {"created_at__gte": created_after, "created_at__lte": created_before}
+
+
+async def get_contact_filters(
+    company: Optional[str] = Query(None),
+    created_range: dict = Depends(get_created_range)
+) -> dict:
+    return {"company": company, **created_range}
+
+
+async def get_deal_filters(
+    stage: Optional[List[str]] = Query(None),
+    status: Optional[List[str]] = Query(None),
+    contact_id: Optional[UUID] = Query(None),
+    min_value: Optional[Decimal] = Query(None),
+    max_value: Optional[Decimal] = Query(None),
+    created_range: dict = Depends(get_created_range)
+) -> dict:
+    return {
+        "stage__in": stage,
+        "status__in": status,
+        "contact_id": contact_id,
+        "value__gte": min_value,
+        "value__lte": max_value,
+        **created_range
+    }
+
+
+async def get_task_filters(
+    status: Optional[List[str]] = Query(None),
+    assigned_to_id: Optional[UUID] = Query(None),
+    deal_id: Optional[UUID] = Query(None),
+    contact_id: Optional[UUID] = Query(None),
+    due_after: Optional[datetime] = Query(None),
+    due_before: Optional[datetime] = Query(None),
+    created_range: dict = Depends(get_created_range)
+) -> dict:
+    return {
+        "status__in": status,
+        "assigned_to_id": assigned_to_id,
+        "deal_id": deal_id,
+        "contact_id": contact_id,
+        "due_date__gte": due_after,
+        "due_date__lte": due_before,
+        **created_range
+    }
+
+
+async def get_activity_filters(
+    type: Optional[List[str]] = Query(None),
+    user_id: Optional[UUID] = Query(None),
+    contact_id: Optional[UUID] = Query(None),
+    task_id: Optional[UUID] = Query(None),
+    created_range: dict = Depends(get_created_range)
+) -> dict:
+    return {
+        "type__in": type,
+        "user_id": user_id,
+        "contact_id": contact_id,
+        "task_id": task_id,
+        **created_range
+    }
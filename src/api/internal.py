@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src import metrics
+from src.database import get_pool_stats
+from src.api.dependencies import require_internal_token
+from src.services.auth_service import password_hasher
+from src.services.activity_writer import activity_writer
+
+router = APIRouter(dependencies=[Depends(require_internal_token)])
+
+
+@router.get("/internal/pool")
+async def pool_stats():
+    return {
+        "database": get_pool_stats(),
+        "password_hasher": password_hasher.stats(),
+        "activity_writer": activity_writer.stats()
+    }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    return PlainTextResponse(metrics.registry.render(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,9 @@
+from typing import Optional, Sequence
+from fastapi import Response
+
+from src.repositories.base_repository import encode_cursor
+
+
+def set_next_cursor(response: Response, items: Sequence, limit: int, sort: Optional[str] = None) -> None:
+    if sort is None and len(items) == limit:
+        response.headers["X-Next-Cursor"] = encode_cursor(items[-1])
@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Any, List, Sequence, Type
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def serialize_list(schema: Type[BaseModel], items: Sequence) -> bytes:
+    adapter = list_adapter(schema)
+    return adapter.dump_json(adapter.validate_python(items, from_attributes=True))
+
+
+def list_response(schema: Type[BaseModel], items: Sequence, response: Response) -> FastJSONResponse:
+    headers = {key: value for key, value in response.headers.items() if key != "content-length"}
+    return FastJSONResponse(serialize_list(schema, items), headers=headers)
@@ -1,31 +1,59 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.repositories.activity_repository import ActivityRepository
-from src.api.dependencies import get_current_user, get_organization_member
+from src.api.dependencies import get_request_context, get_cursor
+from src.api.pagination import set_next_cursor
+from src.api.serialization import list_response
+from src.api.conditional import check_etag, get_version_etag
+from src.api.filters import get_activity_filters, sort_param
 from src.api.v1.schemas import ActivityResponse
-from src.models.user import User
-from src.models.organization_member import OrganizationMember
+from src.services.request_context import RequestContext
+from src.repositories.base_repository import Cursor
 
 router = APIRouter()
 
 
 @router.get("/activities", response_model=List[ActivityResponse])
 async def list_activities(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     deal_id: UUID = Query(None),
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    filters: dict = Depends(get_activity_filters),
+    sort: Optional[str] = Depends(sort_param(ActivityRepository)),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
     activity_repo = ActivityRepository(db)
     if deal_id:
-        activities = await activity_repo.get_by_deal(member.organization_id, deal_id)
+        activities = await activity_repo.get_by_deal(
+            context.organization_id,
+            deal_id,
+            skip,
+            limit,
+            cursor,
+            filters,
+            sort
+        )
     else:
-        activities = await activity_repo.get_by_organization(member.organization_id, skip, limit)
-    return activities
+        activities = await activity_repo.get_by_organization(
+            context.organization_id,
+            skip,
+            limit,
+            cursor,
+            filters,
+            sort
+        )
+    set_next_cursor(response, activities, limit, sort)
+    return list_response(ActivityResponse, activities, response)
 
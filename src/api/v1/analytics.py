@@ -1,25 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.services.analytics_service import AnalyticsService
-from src.api.dependencies import get_current_user, get_organization_member
-from src.api.v1.schemas import DealsSummaryResponse, DealsFunnelResponse
-from src.models.user import User
-from src.models.organization_member import OrganizationMember
+from src.api.dependencies import get_request_context
+from src.api.conditional import check_etag, get_version_etag
+from src.api.v1.schemas import (
+    DealsSummaryResponse, DealsFunnelResponse, DealsOverviewResponse, StageConversionResponse, TimeSeriesResponse
+)
+from src.repositories.analytics_repository import MAX_SERIES_DAYS
+from src.services.request_context import RequestContext
 
 router = APIRouter()
 
 
 @router.get("/analytics/deals/summary", response_model=DealsSummaryResponse)
 async def get_deals_summary(
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    request: Request,
+    response: Response,
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    analytics_service = AnalyticsService(db)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    analytics_service = AnalyticsService(db, context)
     try:
-        summary = await analytics_service.get_deals_summary(member.organization_id, current_user.id)
+        summary = await analytics_service.get_deals_summary(context.organization_id, context.user_id)
         return summary
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
@@ -27,14 +37,131 @@ async def get_deals_summary(
 
 @router.get("/analytics/deals/funnel", response_model=DealsFunnelResponse)
 async def get_deals_funnel(
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    request: Request,
+    response: Response,
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    analytics_service = AnalyticsService(db)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    analytics_service = AnalyticsService(db, context)
     try:
-        funnel = await analytics_service.get_deals_funnel(member.organization_id, current_user.id)
+        funnel = await analytics_service.get_deals_funnel(context.organization_id, context.user_id)
         return funnel
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
+
+@router.get("/analytics/deals/overview", response_model=DealsOverviewResponse)
+async def get_deals_overview(
+    request: Request,
+    response: Response,
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    analytics_service = AnalyticsService(db, context)
+    try:
+        overview = await analytics_service.get_deals_overview(context.organization_id, context.user_id)
+        return overview
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+
+@router.get("/analytics/deals/conversion", response_model=StageConversionResponse)
+async def get_stage_conversion(
+    request: Request,
+    response: Response,
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    analytics_service = AnalyticsService(db, context)
+    try:
+        return await analytics_service.get_stage_conversion(context.organization_id, context.user_id)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+GRANULARITY_PATTERN = "^(day|week|month)$"
+DEFAULT_SERIES_DAYS = {"day": 30, "week": 84, "month": 334}
+
+
+async def get_time_series(name: str, granularity: str, start: Optional[date], end: Optional[date],
+                          context: RequestContext, db: AsyncSession) -> dict:
+    end = end or datetime.now(timezone.utc).date()
+    start = start or end - timedelta(days=DEFAULT_SERIES_DAYS[granularity])
+    if start > end or (end - start).days > MAX_SERIES_DAYS[granularity]:
+        raise HTTPException(status_code=400, detail="invalid date range")
+    analytics_service = AnalyticsService(db, context)
+    try:
+        return await analytics_service.get_time_series(
+            context.organization_id,
+            context.user_id,
+            name,
+            granularity,
+            start,
+            end
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.get("/analytics/deals/created", response_model=TimeSeriesResponse)
+async def get_deals_created(
+    request: Request,
+    response: Response,
+    granularity: str = Query("week", pattern=GRANULARITY_PATTERN),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    return await get_time_series("deals_created", granularity, start, end, context, db)
+
+
+@router.get("/analytics/deals/revenue", response_model=TimeSeriesResponse)
+async def get_deals_revenue(
+    request: Request,
+    response: Response,
+    granularity: str = Query("month", pattern=GRANULARITY_PATTERN),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    return await get_time_series("revenue_won", granularity, start, end, context, db)
+
+
+@router.get("/analytics/tasks/completed", response_model=TimeSeriesResponse)
+async def get_tasks_completed(
+    request: Request,
+    response: Response,
+    granularity: str = Query("day", pattern=GRANULARITY_PATTERN),
+    start: Optional[date] = Query(None),
+    end: Optional[date] = Query(None),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    return await get_time_series("tasks_completed", granularity, start, end, context, db)
@@ -1,30 +1,42 @@
-from typing import List
+import os
+import tempfile
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.database import get_db
+from src.database import get_db, get_session_maker
 from src.services.contact_service import ContactService
-from src.api.dependencies import get_current_user, get_organization_member
-from src.api.v1.schemas import ContactCreate, ContactUpdate, ContactResponse
-from src.models.user import User
-from src.models.organization_member import OrganizationMember
+from src.services.contact_import_service import (
+    ContactImportService, ImportJob, detect_format, get_job, register_job
+)
+from src.api.dependencies import get_request_context, get_cursor
+from src.api.pagination import set_next_cursor
+from src.api.serialization import list_response
+from src.api.conditional import check_etag, check_entity_etag, entity_etag, get_version_etag
+from src.api.filters import get_contact_filters, sort_param
+from src.api.v1.schemas import ContactCreate, ContactUpdate, ContactResponse, ContactListItem, ImportJobResponse
+from src.services.request_context import RequestContext
+from src.repositories.base_repository import Cursor
+from src.repositories.contact_repository import ContactRepository
 
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 @router.post("/contacts", response_model=ContactResponse, status_code=201)
 async def create_contact(
     contact_data: ContactCreate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    contact_service = ContactService(db)
+    contact_service = ContactService(db, context)
     try:
         contact = await contact_service.create_contact(
-            member.organization_id,
-            current_user.id,
+            context.organization_id,
+            context.user_id,
             contact_data.name,
             contact_data.email,
             contact_data.phone,
@@ -36,23 +48,99 @@ async def create_contact(
         raise HTTPException(status_code=403, detail=str(e))
 
 
-@router.get("/contacts", response_model=List[ContactResponse])
+@router.get("/contacts", response_model=List[ContactListItem])
 async def list_contacts(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    filters: dict = Depends(get_contact_filters),
+    sort: Optional[str] = Depends(sort_param(ContactRepository)),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    contact_service = ContactService(db)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    contact_service = ContactService(db, context)
     try:
         contacts = await contact_service.list_contacts(
-            member.organization_id,
-            current_user.id,
+            context.organization_id,
+            context.user_id,
             skip,
+            limit,
+            cursor,
+            filters,
+            sort
+        )
+        set_next_cursor(response, contacts, limit, sort)
+        return list_response(ContactListItem, contacts, response)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.post("/contacts/import", response_model=ImportJobResponse, status_code=202)
+async def import_contacts(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: Optional[str] = Query(None),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db),
+    session_maker: async_sessionmaker = Depends(get_session_maker)
+):
+    try:
+        import_format = detect_format(format, file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    fd, path = tempfile.mkstemp(suffix=f".{import_format}")
+    try:
+        with os.fdopen(fd, "wb") as spool:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await run_in_threadpool(spool.write, chunk)
+            size = spool.tell()
+        job = ImportJob(
+            organization_id=context.organization_id,
+            user_id=context.user_id,
+            format=import_format,
+            bytes_total=size
+        )
+        record = await register_job(db, job)
+    except BaseException:
+        os.remove(path)
+        raise
+    background_tasks.add_task(ContactImportService(session_maker).run, job, path)
+    return record
+
+
+@router.get("/contacts/import/{job_id}", response_model=ImportJobResponse)
+async def get_import_job(
+    job_id: UUID,
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    job = await get_job(db, context.organization_id, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="import job not found")
+    return job
+
+
+@router.get("/contacts/search", response_model=List[ContactResponse])
+async def search_contacts(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    contact_service = ContactService(db, context)
+    try:
+        return await contact_service.search_contacts(
+            context.organization_id,
+            context.user_id,
+            q,
             limit
         )
-        return contacts
     except ValueError as e:
         raise HTTPException(status_code=403, detail=str(e))
 
@@ -60,18 +148,23 @@ async def list_contacts(
 @router.get("/contacts/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    request: Request,
+    response: Response,
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    contact_service = ContactService(db)
+    not_modified = await check_entity_etag(request, response, ContactRepository(db), context.organization_id, contact_id)
+    if not_modified:
+        return not_modified
+    contact_service = ContactService(db, context)
     contact = await contact_service.get_contact(
-        member.organization_id,
+        context.organization_id,
         contact_id,
-        current_user.id
+        context.user_id
     )
     if not contact:
         raise HTTPException(status_code=404, detail="contact not found")
+    response.headers["ETag"] = entity_etag(contact.id, contact.updated_at)
     return contact
 
 
@@ -79,17 +172,16 @@ async def get_contact(
 async def update_contact(
     contact_id: UUID,
     contact_data: ContactUpdate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    contact_service = ContactService(db)
+    contact_service = ContactService(db, context)
     update_data = contact_data.model_dump(exclude_unset=True)
     try:
         contact = await contact_service.update_contact(
-            member.organization_id,
+            context.organization_id,
             contact_id,
-            current_user.id,
+            context.user_id,
             **update_data
         )
         if not contact:
@@ -102,16 +194,15 @@ async def update_contact(
 @router.delete("/contacts/{contact_id}", status_code=204)
 async def delete_contact(
     contact_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    contact_service = ContactService(db)
+    contact_service = ContactService(db, context)
     try:
         result = await contact_service.delete_contact(
-            member.organization_id,
+            context.organization_id,
             contact_id,
-            current_user.id
+            context.user_id
         )
         if not result:
             raise HTTPException(status_code=404, detail="contact not found")
@@ -1,14 +1,19 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.services.deal_service import DealService
-from src.api.dependencies import get_current_user, get_organization_member
-from src.api.v1.schemas import DealCreate, DealUpdate, DealResponse
-from src.models.user import User
-from src.models.organization_member import OrganizationMember
+from src.api.dependencies import get_request_context, get_cursor
+from src.api.pagination import set_next_cursor
+from src.api.serialization import list_response
+from src.api.conditional import check_etag, check_entity_etag, entity_etag, get_version_etag
+from src.api.filters import get_deal_filters, sort_param
+from src.api.v1.schemas import DealCreate, DealUpdate, DealResponse, DealListItem, DealBatchUpdate, DealBatchResponse
+from src.services.request_context import RequestContext
+from src.repositories.base_repository import Cursor
+from src.repositories.deal_repository import DealRepository
 
 router = APIRouter()
 
@@ -16,15 +21,14 @@ router = APIRouter()
 @router.post("/deals", response_model=DealResponse, status_code=201)
 async def create_deal(
     deal_data: DealCreate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    deal_service = DealService(db, context)
     try:
         deal = await deal_service.create_deal(
-            member.organization_id,
-            current_user.id,
+            context.organization_id,
+            context.user_id,
             deal_data.contact_id,
             deal_data.title,
             deal_data.value,
@@ -36,39 +40,56 @@ async def create_deal(
         raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/deals", response_model=List[DealResponse])
+@router.get("/deals", response_model=List[DealListItem])
 async def list_deals(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    filters: dict = Depends(get_deal_filters),
+    sort: Optional[str] = Depends(sort_param(DealRepository)),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    deal_service = DealService(db, context)
     deals = await deal_service.list_deals(
-        member.organization_id,
-        current_user.id,
+        context.organization_id,
+        context.user_id,
         skip,
-        limit
+        limit,
+        cursor,
+        filters,
+        sort
     )
-    return deals
+    set_next_cursor(response, deals, limit, sort)
+    return list_response(DealListItem, deals, response)
 
 
 @router.get("/deals/{deal_id}", response_model=DealResponse)
 async def get_deal(
     deal_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    request: Request,
+    response: Response,
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    not_modified = await check_entity_etag(request, response, DealRepository(db), context.organization_id, deal_id)
+    if not_modified:
+        return not_modified
+    deal_service = DealService(db, context)
     deal = await deal_service.get_deal(
-        member.organization_id,
+        context.organization_id,
         deal_id,
-        current_user.id
+        context.user_id
     )
     if not deal:
         raise HTTPException(status_code=404, detail="deal not found")
+    response.headers["ETag"] = entity_etag(deal.id, deal.updated_at)
     return deal
 
 
@@ -76,17 +97,16 @@ async def get_deal(
 async def update_deal(
     deal_id: UUID,
     deal_data: DealUpdate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    deal_service = DealService(db, context)
     update_data = deal_data.model_dump(exclude_unset=True)
     try:
         deal = await deal_service.update_deal(
-            member.organization_id,
+            context.organization_id,
             deal_id,
-            current_user.id,
+            context.user_id,
             **update_data
         )
         if not deal:
@@ -96,19 +116,40 @@ async def update_deal(
         raise HTTPException(status_code=403, detail=str(e))
 
 
+@router.patch("/deals:batch", response_model=DealBatchResponse)
+async def update_deals(
+    deal_data: DealBatchUpdate,
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    deal_service = DealService(db, context)
+    update_data = deal_data.model_dump(exclude_unset=True, exclude={"ids"})
+    deal_ids = list(dict.fromkeys(deal_data.ids))
+    try:
+        deals = await deal_service.update_deals(
+            context.organization_id,
+            deal_ids,
+            context.user_id,
+            **update_data
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    updated = {deal.id for deal in deals}
+    return {"updated": deals, "missing": [deal_id for deal_id in deal_ids if deal_id not in updated]}
+
+
 @router.post("/deals/{deal_id}/close", response_model=DealResponse)
 async def close_deal(
     deal_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    deal_service = DealService(db, context)
     try:
         deal = await deal_service.close_deal(
-            member.organization_id,
+            context.organization_id,
             deal_id,
-            current_user.id
+            context.user_id
         )
         if not deal:
             raise HTTPException(status_code=404, detail="deal not found")
@@ -120,16 +161,15 @@ async def close_deal(
 @router.delete("/deals/{deal_id}", status_code=204)
 async def delete_deal(
     deal_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    deal_service = DealService(db)
+    deal_service = DealService(db, context)
     try:
         result = await deal_service.delete_deal(
-            member.organization_id,
+            context.organization_id,
             deal_id,
-            current_user.id
+            context.user_id
         )
         if not result:
             raise HTTPException(status_code=404, detail="deal not found")
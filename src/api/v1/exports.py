@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database import get_session_maker
+from src.services.export_service import ExportService, EXPORT_FORMATS
+from src.api.dependencies import get_request_context
+from src.services.request_context import RequestContext
+
+router = APIRouter()
+
+
+@router.get("/export/{entity}")
+async def export_entity(
+    entity: str,
+    format: str = Query("csv", pattern=f"^({'|'.join(EXPORT_FORMATS)})$"),
+    context: RequestContext = Depends(get_request_context),
+    session_maker: async_sessionmaker = Depends(get_session_maker)
+):
+    export_service = ExportService(session_maker)
+    try:
+        export_service.check_access(context.member, entity)
+    except ValueError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    extension = "csv" if format == "csv" else "ndjson"
+    return StreamingResponse(
+        export_service.stream(context.organization_id, entity, format),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{extension}"'}
+    )
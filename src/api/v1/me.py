@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database import get_session_maker
+from src.services.dashboard_service import DashboardService
+from src.api.dependencies import get_request_context
+from src.api.v1.schemas import DashboardResponse
+from src.services.request_context import RequestContext
+
+router = APIRouter()
+
+
+@router.get("/me/dashboard", response_model=DashboardResponse)
+async def get_dashboard(
+    limit: int = Query(20, ge=1, le=100),
+    context: RequestContext = Depends(get_request_context),
+    session_maker: async_sessionmaker = Depends(get_session_maker)
+):
+    dashboard_service = DashboardService(session_maker, context)
+    return await dashboard_service.get_dashboard(limit)
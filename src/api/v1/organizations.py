@@ -6,7 +6,7 @@ from src.database import get_db
 from src.services.organization_service import OrganizationService
 from src.api.dependencies import get_current_user, get_organization_id, get_organization_member
 from src.api.v1.schemas import OrganizationCreate, OrganizationResponse, MemberAdd, MemberResponse
-from src.models.user import User
+from src.services.request_context import CurrentUser
 from src.models.organization_member import OrganizationMember
 
 router = APIRouter()
@@ -15,7 +15,7 @@ router = APIRouter()
 @router.post("/organizations", response_model=OrganizationResponse, status_code=201)
 async def create_organization(
     org_data: OrganizationCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: CurrentUser = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     org_service = OrganizationService(db)
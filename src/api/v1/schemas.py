@@ -1,7 +1,9 @@
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
-from datetime import datetime
-from pydantic import BaseModel, EmailStr
+from datetime import date, datetime
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+MAX_BATCH_SIZE = 1000
 
 
 class UserCreate(BaseModel):
@@ -75,14 +77,13 @@ class ContactUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class ContactResponse(BaseModel):
+class ContactListItem(BaseModel):
     id: UUID
     organization_id: UUID
     name: str
     email: Optional[str]
     phone: Optional[str]
     company: Optional[str]
-    notes: Optional[str]
     created_at: datetime
     updated_at: datetime
 
@@ -90,6 +91,30 @@ class ContactResponse(BaseModel):
         from_attributes = True
 
 
+class ContactResponse(ContactListItem):
+    notes: Optional[str]
+
+
+class ImportErrorResponse(BaseModel):
+    row: int
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    id: UUID
+    status: str
+    format: str
+    bytes_total: int
+    bytes_processed: int
+    processed: int
+    imported: int
+    failed: int
+    errors: List[ImportErrorResponse]
+
+    class Config:
+        from_attributes = True
+
+
 class DealCreate(BaseModel):
     contact_id: UUID
     title: str
@@ -105,7 +130,17 @@ class DealUpdate(BaseModel):
     notes: Optional[str] = None
 
 
-class DealResponse(BaseModel):
+class DealBatchUpdate(DealUpdate):
+    ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+    @model_validator(mode="after")
+    def require_changes(self) -> "DealBatchUpdate":
+        if not self.model_fields_set - {"ids"}:
+            raise ValueError("at least one field to update is required")
+        return self
+
+
+class DealListItem(BaseModel):
     id: UUID
     organization_id: UUID
     contact_id: UUID
@@ -113,7 +148,6 @@ class DealResponse(BaseModel):
     value: Optional[float]
     stage: str
     status: str
-    notes: Optional[str]
     created_at: datetime
     updated_at: datetime
     closed_at: Optional[datetime]
@@ -122,6 +156,15 @@ class DealResponse(BaseModel):
         from_attributes = True
 
 
+class DealResponse(DealListItem):
+    notes: Optional[str]
+
+
+class DealBatchResponse(BaseModel):
+    updated: List[DealResponse]
+    missing: List[UUID]
+
+
 class TaskCreate(BaseModel):
     title: str
     description: Optional[str] = None
@@ -141,6 +184,10 @@ class TaskUpdate(BaseModel):
     due_date: Optional[datetime] = None
 
 
+class TaskBatchComplete(BaseModel):
+    ids: List[UUID] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
 class TaskResponse(BaseModel):
     id: UUID
     organization_id: UUID
@@ -159,6 +206,15 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+class TaskBatchResponse(BaseModel):
+    completed: List[TaskResponse]
+    skipped: List[UUID]
+
+
+class TaskCountResponse(BaseModel):
+    count: int
+
+
 class ActivityResponse(BaseModel):
     id: UUID
     organization_id: UUID
@@ -168,6 +224,8 @@ class ActivityResponse(BaseModel):
     task_id: Optional[UUID]
     type: str
     description: Optional[str]
+    from_stage: Optional[str] = None
+    to_stage: Optional[str] = None
     created_at: datetime
 
     class Config:
@@ -187,3 +245,55 @@ class DealsFunnelResponse(BaseModel):
     negotiation: int
     closed: int
 
+    class Config:
+        extra = "allow"
+
+
+class DashboardResponse(BaseModel):
+    tasks: Optional[List[TaskResponse]]
+    deals: Optional[List[DealListItem]]
+    activities: Optional[List[ActivityResponse]]
+    summary: Optional[DealsSummaryResponse]
+    timed_out: List[str]
+
+
+class StageStatsResponse(BaseModel):
+    stage: str
+    count: int
+    total_value: float
+
+
+class DealsOverviewResponse(BaseModel):
+    summary: DealsSummaryResponse
+    stages: List[StageStatsResponse]
+
+
+class StageConversion(BaseModel):
+    to_stage: str
+    count: int
+    rate: float
+    median_seconds: Optional[float]
+
+
+class StageVelocity(BaseModel):
+    stage: str
+    entered: int
+    exited: int
+    median_seconds: Optional[float]
+    conversions: List[StageConversion]
+
+
+class StageConversionResponse(BaseModel):
+    stages: List[StageVelocity]
+
+
+class TimeSeriesPoint(BaseModel):
+    bucket: date
+    count: int
+    value: float
+
+
+class TimeSeriesResponse(BaseModel):
+    granularity: str
+    points: List[TimeSeriesPoint]
+
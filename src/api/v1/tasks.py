@@ -1,14 +1,19 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database import get_db
 from src.services.task_service import TaskService
-from src.api.dependencies import get_current_user, get_organization_member
-from src.api.v1.schemas import TaskCreate, TaskUpdate, TaskResponse
-from src.models.user import User
-from src.models.organization_member import OrganizationMember
+from src.api.dependencies import get_request_context, get_cursor
+from src.api.pagination import set_next_cursor
+from src.api.serialization import list_response
+from src.api.conditional import check_etag, check_entity_etag, entity_etag, get_version_etag
+from src.api.filters import get_task_filters, sort_param
+from src.api.v1.schemas import TaskCreate, TaskUpdate, TaskResponse, TaskCountResponse, TaskBatchComplete, TaskBatchResponse
+from src.services.request_context import RequestContext
+from src.repositories.base_repository import Cursor
+from src.repositories.task_repository import TaskRepository
 
 router = APIRouter()
 
@@ -16,15 +21,14 @@ router = APIRouter()
 @router.post("/tasks", response_model=TaskResponse, status_code=201)
 async def create_task(
     task_data: TaskCreate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    task_service = TaskService(db, context)
     try:
         task = await task_service.create_task(
-            member.organization_id,
-            current_user.id,
+            context.organization_id,
+            context.user_id,
             task_data.title,
             task_data.description,
             task_data.deal_id,
@@ -39,37 +43,98 @@ async def create_task(
 
 @router.get("/tasks", response_model=List[TaskResponse])
 async def list_tasks(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    cursor: Optional[Cursor] = Depends(get_cursor),
+    filters: dict = Depends(get_task_filters),
+    sort: Optional[str] = Depends(sort_param(TaskRepository)),
+    etag: Optional[str] = Depends(get_version_etag),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    not_modified = check_etag(request, response, etag)
+    if not_modified:
+        return not_modified
+    task_service = TaskService(db, context)
     tasks = await task_service.list_tasks(
-        member.organization_id,
-        current_user.id,
+        context.organization_id,
+        context.user_id,
         skip,
+        limit,
+        cursor,
+        filters,
+        sort
+    )
+    set_next_cursor(response, tasks, limit, sort)
+    return list_response(TaskResponse, tasks, response)
+
+
+@router.get("/tasks/overdue", response_model=List[TaskResponse])
+async def list_overdue_tasks(
+    mine: bool = Query(False),
+    limit: int = Query(100, ge=1, le=100),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    task_service = TaskService(db, context)
+    return await task_service.list_overdue_tasks(
+        context.organization_id,
+        context.user_id,
+        mine,
+        limit
+    )
+
+
+@router.get("/tasks/overdue/count", response_model=TaskCountResponse)
+async def count_overdue_tasks(
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    task_service = TaskService(db, context)
+    count = await task_service.count_overdue_tasks(context.organization_id, context.user_id)
+    return {"count": count}
+
+
+@router.get("/tasks/due-soon", response_model=List[TaskResponse])
+async def list_due_soon_tasks(
+    days: int = Query(7, ge=1, le=90),
+    mine: bool = Query(False),
+    limit: int = Query(100, ge=1, le=100),
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    task_service = TaskService(db, context)
+    return await task_service.list_due_soon_tasks(
+        context.organization_id,
+        context.user_id,
+        days,
+        mine,
         limit
     )
-    return tasks
 
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    request: Request,
+    response: Response,
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    not_modified = await check_entity_etag(request, response, TaskRepository(db), context.organization_id, task_id)
+    if not_modified:
+        return not_modified
+    task_service = TaskService(db, context)
     task = await task_service.get_task(
-        member.organization_id,
+        context.organization_id,
         task_id,
-        current_user.id
+        context.user_id
     )
     if not task:
         raise HTTPException(status_code=404, detail="task not found")
+    response.headers["ETag"] = entity_etag(task.id, task.updated_at)
     return task
 
 
@@ -77,17 +142,16 @@ async def get_task(
 async def update_task(
     task_id: UUID,
     task_data: TaskUpdate,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    task_service = TaskService(db, context)
     update_data = task_data.model_dump(exclude_unset=True)
     try:
         task = await task_service.update_task(
-            member.organization_id,
+            context.organization_id,
             task_id,
-            current_user.id,
+            context.user_id,
             **update_data
         )
         if not task:
@@ -100,16 +164,15 @@ async def update_task(
 @router.post("/tasks/{task_id}/complete", response_model=TaskResponse)
 async def complete_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    task_service = TaskService(db, context)
     try:
         task = await task_service.complete_task(
-            member.organization_id,
+            context.organization_id,
             task_id,
-            current_user.id
+            context.user_id
         )
         if not task:
             raise HTTPException(status_code=404, detail="task not found")
@@ -118,19 +181,38 @@ async def complete_task(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/tasks:batch-complete", response_model=TaskBatchResponse)
+async def complete_tasks(
+    task_data: TaskBatchComplete,
+    context: RequestContext = Depends(get_request_context),
+    db: AsyncSession = Depends(get_db)
+):
+    task_service = TaskService(db, context)
+    task_ids = list(dict.fromkeys(task_data.ids))
+    try:
+        tasks = await task_service.complete_tasks(
+            context.organization_id,
+            task_ids,
+            context.user_id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    completed = {task.id for task in tasks}
+    return {"completed": tasks, "skipped": [task_id for task_id in task_ids if task_id not in completed]}
+
+
 @router.delete("/tasks/{task_id}", status_code=204)
 async def delete_task(
     task_id: UUID,
-    current_user: User = Depends(get_current_user),
-    member: OrganizationMember = Depends(get_organization_member),
+    context: RequestContext = Depends(get_request_context),
     db: AsyncSession = Depends(get_db)
 ):
-    task_service = TaskService(db)
+    task_service = TaskService(db, context)
     try:
         result = await task_service.delete_task(
-            member.organization_id,
+            context.organization_id,
             task_id,
-            current_user.id
+            context.user_id
         )
         if not result:
             raise HTTPException(status_code=404, detail="task not found")
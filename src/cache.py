@@ -0,0 +1,174 @@
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from src.config import app_settings
+
+
+class LRUCache:
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 60):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int = 10000):
+        self._values = LRUCache(max_entries)
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        if key in self._counters:
+            return self._counters[key]
+        return self._values.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._values.set(key, value, ttl_seconds)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, url: str):
+        try:
+            from redis import asyncio as redis
+        except ImportError:
+            raise RuntimeError("redis package is required for cache_url")
+        self._client = redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(key)
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self._client.set(key, json.dumps(value), ex=max(int(ttl_seconds), 1))
+
+    async def incr(self, key: str) -> int:
+        return await self._client.incr(key)
+
+
+class AnalyticsCache:
+    def __init__(self, local: LRUCache, shared: Optional[CacheBackend] = None, history_ttl_seconds: float = 604800):
+        self.local = local
+        self.shared = shared
+        self.history_ttl_seconds = history_ttl_seconds
+        self._versions: Dict[Tuple[str, UUID], int] = {}
+
+    @staticmethod
+    def _version_key(organization_id: UUID, scope: str) -> str:
+        return f"{scope}_version:{organization_id}"
+
+    async def get_version(self, organization_id: UUID, scope: str = "analytics") -> int:
+        if self.shared is None:
+            return self._versions.get((scope, organization_id), 0)
+        return int(await self.shared.get(self._version_key(organization_id, scope)) or 0)
+
+    async def _bump(self, organization_id: UUID, scopes: Tuple[str, ...]) -> None:
+        for scope in scopes:
+            if self.shared is None:
+                self._versions[(scope, organization_id)] = self._versions.get((scope, organization_id), 0) + 1
+            else:
+                await self.shared.incr(self._version_key(organization_id, scope))
+
+    async def touch(self, organization_id: UUID) -> None:
+        await self._bump(organization_id, ("data",))
+
+    async def invalidate(self, organization_id: UUID, history: bool = False) -> None:
+        await self._bump(organization_id, ("data", "analytics", "history") if history else ("data", "analytics"))
+
+    async def get_history(self, organization_id: UUID, name: str, buckets: List[str]) -> Tuple[int, Dict[str, Any]]:
+        version = await self.get_version(organization_id, "history")
+        values = {}
+        for bucket in buckets:
+            key = f"{name}:{organization_id}:h{version}:{bucket}"
+            value = self.local.get(key)
+            if value is None and self.shared is not None:
+                value = await self.shared.get(key)
+                if value is not None:
+                    self.local.set(key, value, self.history_ttl_seconds)
+            if value is not None:
+                values[bucket] = value
+        return version, values
+
+    async def set_history(self, organization_id: UUID, name: str, version: int, values: Dict[str, Any]) -> None:
+        for bucket, value in values.items():
+            key = f"{name}:{organization_id}:h{version}:{bucket}"
+            self.local.set(key, value, self.history_ttl_seconds)
+            if self.shared is not None:
+                await self.shared.set(key, value, self.history_ttl_seconds)
+
+    async def get_or_compute(self, organization_id: UUID, name: str,
+                             compute: Callable[[], Awaitable[Any]]) -> Any:
+        version = await self.get_version(organization_id)
+        key = f"{name}:{organization_id}:{version}"
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = await self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        if value is None:
+            value = await compute()
+            self.local.set(key, value)
+            if self.shared is not None:
+                await self.shared.set(key, value, self.local.ttl_seconds)
+        return value
+
+
+analytics_cache = AnalyticsCache(
+    LRUCache(app_settings.analytics_cache_max_entries, app_settings.analytics_cache_ttl_seconds),
+    RedisCacheBackend(app_settings.cache_url) if app_settings.cache_url else None,
+    app_settings.analytics_history_ttl_seconds
+)
+
+token_cache = LRUCache(app_settings.auth_token_cache_max_entries, 0)
+
+user_cache = LRUCache(app_settings.auth_user_cache_max_entries, app_settings.auth_user_cache_ttl_seconds)
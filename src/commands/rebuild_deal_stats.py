@@ -0,0 +1,27 @@
+import argparse
+import asyncio
+from typing import Optional
+from uuid import UUID
+
+from src.database import async_session_maker
+from src.repositories.deal_stat_repository import DealStatRepository
+from src.cache import analytics_cache
+
+
+async def rebuild_deal_stats(organization_id: Optional[UUID] = None) -> None:
+    async with async_session_maker() as session:
+        organization_ids = await DealStatRepository(session).rebuild(organization_id)
+        await session.commit()
+    for rebuilt_id in organization_ids:
+        await analytics_cache.invalidate(rebuilt_id)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="rebuild deal_stats from the deals table")
+    parser.add_argument("--organization-id", type=UUID, default=None)
+    args = parser.parse_args()
+    asyncio.run(rebuild_deal_stats(args.organization_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from typing import Literal, Optional
 from pydantic_settings import BaseSettings
 
 
@@ -5,8 +6,41 @@ class settings(BaseSettings):
     database_url: str
     secret_key: str
     algorithm: str = "HS256"
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: Optional[int] = None
+    db_prepared_statement_cache_size: int = 100
+    db_pooler_transaction_mode: bool = False
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    analytics_cache_ttl_seconds: int = 60
+    analytics_cache_max_entries: int = 1024
+    analytics_history_ttl_seconds: int = 604800
+    cache_url: Optional[str] = None
+    password_hash_workers: int = 4
+    contact_import_batch_size: int = 1000
+    contact_import_stale_seconds: int = 600
+    contact_search_index_max_organizations: int = 256
+    export_batch_size: int = 1000
+    activity_log_mode: Literal["durable", "async"] = "durable"
+    activity_batch_size: int = 500
+    activity_flush_interval_ms: int = 50
+    activity_queue_max_size: int = 10000
+    task_overdue_scan_interval_seconds: int = 60
+    task_overdue_scan_batch_size: int = 500
+    dashboard_timeout_ms: int = 1000
+    local_version_etags: bool = False
+    server_timing_enabled: bool = False
+    internal_token: Optional[str] = None
+    slow_query_threshold_ms: Optional[int] = None
+    n_plus_one_threshold: int = 10
+    auth_cache_enabled: bool = False
+    auth_token_cache_max_entries: int = 10000
+    auth_user_cache_ttl_seconds: int = 60
+    auth_user_cache_max_entries: int = 10000
 
     class config:
         env_file = ".env"
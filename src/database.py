@@ -1,13 +1,90 @@
+import logging
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue
 
+from src import metrics
 from src.config import app_settings
 
-engine = create_async_engine(
-    app_settings.database_url,
-    echo=False,
-    future=True
-)
+logger = logging.getLogger(__name__)
+
+
+class TimedQueue(AsyncAdaptedQueue):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def get(self, block=True, timeout=None):
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.wait_time_total += elapsed
+            self.wait_time_max = max(self.wait_time_max, elapsed)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = TimedQueue
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+
+    @property
+    def wait_time_total(self) -> float:
+        return self._pool.wait_time_total
+
+    @property
+    def wait_time_max(self) -> float:
+        return self._pool.wait_time_max
+
+    def connect(self):
+        self.checkouts += 1
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+
+
+def engine_options() -> dict:
+    options = {"echo": False, "future": True}
+    if not app_settings.database_url.startswith("postgresql"):
+        return options
+    connect_args = {}
+    if app_settings.db_pooler_transaction_mode:
+        connect_args["statement_cache_size"] = 0
+        connect_args["prepared_statement_cache_size"] = 0
+        connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+        options["poolclass"] = NullPool
+    else:
+        connect_args["prepared_statement_cache_size"] = app_settings.db_prepared_statement_cache_size
+        if app_settings.db_statement_timeout_ms:
+            connect_args["server_settings"] = {"statement_timeout": str(app_settings.db_statement_timeout_ms)}
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            pool_size=app_settings.db_pool_size,
+            max_overflow=app_settings.db_max_overflow,
+            pool_timeout=app_settings.db_pool_timeout,
+            pool_recycle=app_settings.db_pool_recycle,
+            pool_pre_ping=app_settings.db_pool_pre_ping
+        )
+    options["connect_args"] = connect_args
+    return options
+
+
+engine = create_async_engine(app_settings.database_url, **engine_options())
 
 async_session_maker = async_sessionmaker(
     engine,
@@ -18,7 +95,72 @@ async_session_maker = async_sessionmaker(
 Base = declarative_base()
 
 
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        return [(statement, count) for statement, count in self.statements.items() if count >= threshold]
+
+
+query_counter: ContextVar[Optional[QueryCounter]] = ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def count_query(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+    counter = query_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def time_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    metrics.query_duration.observe(elapsed)
+    counter = query_counter.get()
+    if counter is not None:
+        counter.duration += elapsed
+        counter.statements[statement] = counter.statements.get(statement, 0) + 1
+    threshold = app_settings.slow_query_threshold_ms
+    if threshold is not None and elapsed * 1000 >= threshold:
+        metrics.slow_queries.inc()
+        logger.warning("slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+@event.listens_for(Engine, "handle_error")
+def discard_query_start(context):
+    if context.connection is not None and context.connection.info.get("query_start"):
+        context.connection.info["query_start"].pop()
+
+
+def get_pool_stats(pool=None) -> dict:
+    pool = pool or engine.pool
+    stats = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0)
+        )
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            wait_time_total=pool.wait_time_total,
+            wait_time_max=pool.wait_time_max,
+            wait_time_avg=pool.wait_time_total / pool.checkouts if pool.checkouts else 0.0
+        )
+    return stats
+
+
 async def get_db():
     async with async_session_maker() as session:
         yield session
 
+
+def get_session_maker() -> async_sessionmaker:
+    return async_session_maker
@@ -1,9 +1,36 @@
-from fastapi import FastAPI
+import logging
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
-from src.api.v1 import auth, organizations, contacts, deals, tasks, activities, analytics
+from src import metrics
+from src.config import app_settings
+from src.database import QueryCounter, query_counter, async_session_maker
+from src.services.activity_writer import activity_writer
+from src.services.task_reminder import overdue_task_scanner
+from src.services.contact_import_service import fail_stale_jobs
+from src.api import internal
+from src.api.v1 import auth, organizations, contacts, deals, tasks, activities, analytics, exports, me
 
-app = FastAPI(title="mini-crm", version="1.0.0")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await fail_stale_jobs(async_session_maker)
+    except Exception:
+        logger.exception("failed to reap stale contact import jobs")
+    if app_settings.activity_log_mode == "async":
+        await activity_writer.start(async_session_maker)
+    await overdue_task_scanner.start(async_session_maker)
+    yield
+    await overdue_task_scanner.stop()
+    await activity_writer.stop()
+
+
+app = FastAPI(title="mini-crm", version="1.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -13,6 +40,35 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def instrument_requests(request: Request, call_next):
+    counter = QueryCounter()
+    token = query_counter.set(counter)
+    start = time.perf_counter()
+    try:
+        response = await call_next(request)
+    finally:
+        query_counter.reset(token)
+    elapsed = time.perf_counter() - start
+    route = request.scope.get("route")
+    labels = (request.method, route.path if route is not None else "unmatched")
+    metrics.request_duration.observe(elapsed, labels + (response.status_code,))
+    metrics.request_queries.inc(labels, counter.count)
+    metrics.request_db_time.inc(labels, counter.duration)
+    repeated = counter.repeated(app_settings.n_plus_one_threshold)
+    if repeated:
+        metrics.n_plus_one.inc(labels)
+        for statement, count in repeated:
+            logger.warning("possible n+1 in %s %s: %d executions of %s", *labels, count, statement)
+    response.headers["X-Query-Count"] = str(counter.count)
+    if app_settings.server_timing_enabled:
+        response.headers["Server-Timing"] = (
+            f"db;dur={counter.duration * 1000:.1f};desc=\"{counter.count} queries\", app;dur={elapsed * 1000:.1f}"
+        )
+    return response
+
+
 app.include_router(auth.router, prefix="/api/v1", tags=["auth"])
 app.include_router(organizations.router, prefix="/api/v1", tags=["organizations"])
 app.include_router(contacts.router, prefix="/api/v1", tags=["contacts"])
@@ -20,6 +76,9 @@ app.include_router(deals.router, prefix="/api/v1", tags=["deals"])
 app.include_router(tasks.router, prefix="/api/v1", tags=["tasks"])
 app.include_router(activities.router, prefix="/api/v1", tags=["activities"])
 app.include_router(analytics.router, prefix="/api/v1", tags=["analytics"])
+app.include_router(exports.router, prefix="/api/v1", tags=["exports"])
+app.include_router(me.router, prefix="/api/v1", tags=["me"])
+app.include_router(internal.router, tags=["internal"])
 
 
 @app.get("/")
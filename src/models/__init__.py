@@ -5,6 +5,8 @@ from src.models.contact import Contact
 from src.models.deal import Deal
 from src.models.task import Task
 from src.models.activity import Activity
+from src.models.deal_stat import DealStat
+from src.models.contact_import_job import ContactImportJob
 
 __all__ = [
     "Organization",
@@ -14,5 +16,7 @@ __all__ = [
     "Deal",
     "Task",
     "Activity",
+    "DealStat",
+    "ContactImportJob",
 ]
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -17,6 +17,8 @@ class Activity(Base):
     task_id = Column(UUID(as_uuid=True), ForeignKey("tasks.id"))
     type = Column(String(100), nullable=False)
     description = Column(Text)
+    from_stage = Column(String(100))
+    to_stage = Column(String(100))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     organization = relationship("Organization", backref="activities")
@@ -25,3 +27,9 @@ class Activity(Base):
     contact = relationship("Contact", backref="activities")
     task = relationship("Task", backref="activities")
 
+    __table_args__ = (
+        Index("ix_activities_organization_id_created_at", organization_id, created_at.desc()),
+        Index("ix_activities_organization_id_deal_id_created_at", organization_id, deal_id, created_at.desc()),
+        Index("ix_activities_organization_id_type", organization_id, type),
+    )
+
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text, Index, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,19 @@ import uuid
 from src.database import Base
 
 
+def contact_search_vector(name, email, phone, company):
+    blank = literal_column("''")
+    space = literal_column("' '")
+    document = func.coalesce(name, blank)
+    for field in (
+        func.replace(func.coalesce(email, blank), literal_column("'@'"), space),
+        func.coalesce(phone, blank),
+        func.coalesce(company, blank)
+    ):
+        document = document.op("||")(space).op("||")(field)
+    return func.to_tsvector(literal_column("'simple'::regconfig"), document)
+
+
 class Contact(Base):
     __tablename__ = "contacts"
 
@@ -21,3 +34,13 @@ class Contact(Base):
 
     organization = relationship("Organization", backref="contacts")
 
+    __table_args__ = (
+        Index("ix_contacts_organization_id_created_at", organization_id, created_at),
+        Index("ix_contacts_organization_id_company", organization_id, company),
+        Index(
+            "ix_contacts_search_vector",
+            contact_search_vector(name, email, phone, company),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
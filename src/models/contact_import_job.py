@@ -0,0 +1,23 @@
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, Integer, BigInteger, JSON
+from sqlalchemy.dialects.postgresql import UUID
+import uuid
+
+from src.database import Base
+
+
+class ContactImportJob(Base):
+    __tablename__ = "contact_import_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    format = Column(String(20), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")
+    bytes_total = Column(BigInteger, nullable=False, default=0)
+    bytes_processed = Column(BigInteger, nullable=False, default=0)
+    processed = Column(Integer, nullable=False, default=0)
+    imported = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    errors = Column(JSON, nullable=False, default=list)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Numeric, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, Numeric, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -24,3 +24,11 @@ class Deal(Base):
     organization = relationship("Organization", backref="deals")
     contact = relationship("Contact", backref="deals")
 
+    __table_args__ = (
+        Index("ix_deals_organization_id_stage", organization_id, stage),
+        Index("ix_deals_organization_id_created_at", organization_id, created_at),
+        Index("ix_deals_organization_id_status", organization_id, status),
+        Index("ix_deals_organization_id_contact_id", organization_id, contact_id),
+        Index("ix_deals_organization_id_closed_at", organization_id, closed_at),
+    )
+
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, ForeignKey, Integer, Numeric
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.database import Base
+
+
+class DealStat(Base):
+    __tablename__ = "deal_stats"
+
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), primary_key=True)
+    stage = Column(String(100), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    valued_count = Column(Integer, nullable=False, default=0)
+    total_value = Column(Numeric(18, 2), nullable=False, default=0)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, UniqueConstraint
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, UniqueConstraint, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -21,5 +21,6 @@ class OrganizationMember(Base):
 
     __table_args__ = (
         UniqueConstraint('organization_id', 'user_id', name='uq_org_user'),
+        Index('ix_organization_members_user_id', 'user_id'),
     )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text
+from sqlalchemy import Column, String, ForeignKey, DateTime, func, Text, Index, and_, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -6,6 +6,10 @@ import uuid
 from src.database import Base
 
 
+def open_task(status):
+    return status != literal_column("'completed'")
+
+
 class Task(Base):
     __tablename__ = "tasks"
 
@@ -21,9 +25,32 @@ class Task(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     completed_at = Column(DateTime(timezone=True))
+    overdue_notified_at = Column(DateTime(timezone=True))
 
     organization = relationship("Organization", backref="tasks")
     deal = relationship("Deal", backref="tasks")
     contact = relationship("Contact", backref="tasks")
     assigned_to = relationship("User", backref="tasks")
 
+    __table_args__ = (
+        Index("ix_tasks_organization_id_assigned_to_id", organization_id, assigned_to_id),
+        Index("ix_tasks_organization_id_created_at", organization_id, created_at),
+        Index("ix_tasks_organization_id_status", organization_id, status),
+        Index("ix_tasks_organization_id_due_date", organization_id, due_date),
+        Index("ix_tasks_organization_id_deal_id", organization_id, deal_id),
+        Index("ix_tasks_organization_id_completed_at", organization_id, completed_at),
+        Index(
+            "ix_tasks_organization_id_open_due_date",
+            organization_id,
+            due_date,
+            postgresql_where=open_task(status),
+            sqlite_where=open_task(status)
+        ),
+        Index(
+            "ix_tasks_overdue_unnotified",
+            due_date,
+            postgresql_where=and_(open_task(status), overdue_notified_at.is_(None)),
+            sqlite_where=and_(open_task(status), overdue_notified_at.is_(None))
+        ),
+    )
+
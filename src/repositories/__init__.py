@@ -5,6 +5,8 @@ from src.repositories.contact_repository import ContactRepository
 from src.repositories.deal_repository import DealRepository
 from src.repositories.task_repository import TaskRepository
 from src.repositories.activity_repository import ActivityRepository
+from src.repositories.deal_stat_repository import DealStatRepository
+from src.repositories.contact_import_job_repository import ContactImportJobRepository
 
 __all__ = [
     "OrganizationRepository",
@@ -14,5 +16,7 @@ __all__ = [
     "DealRepository",
     "TaskRepository",
     "ActivityRepository",
+    "DealStatRepository",
+    "ContactImportJobRepository",
 ]
 
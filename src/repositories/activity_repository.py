@@ -1,37 +1,60 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, Row
 
 from src.models.activity import Activity
-from src.repositories.base_repository import BaseRepository
+from src.repositories.base_repository import BaseRepository, Cursor
 
 
 class ActivityRepository(BaseRepository[Activity]):
+    filter_fields = {
+        "type": ("eq", "in"),
+        "user_id": ("eq",),
+        "contact_id": ("eq",),
+        "task_id": ("eq",),
+        "created_at": ("gte", "lte"),
+    }
+
     def __init__(self, session: AsyncSession):
         super().__init__(Activity, session)
 
-    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[Activity]:
+    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100,
+                                  cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                                  sort: Optional[str] = None) -> List[Row]:
         result = await self.session.execute(
-            select(Activity)
-            .options(selectinload(Activity.user))
-            .where(Activity.organization_id == organization_id)
-            .order_by(Activity.created_at.desc())
-            .offset(skip)
-            .limit(limit)
+            self.paginate(
+                self.apply_filters(
+                    select(*self.list_columns())
+                    .where(Activity.organization_id == organization_id),
+                    filters
+                ),
+                skip,
+                limit,
+                cursor,
+                sort
+            )
         )
-        return list(result.scalars().all())
+        return list(result.all())
 
-    async def get_by_deal(self, organization_id: UUID, deal_id: UUID) -> List[Activity]:
+    async def get_by_deal(self, organization_id: UUID, deal_id: UUID, skip: int = 0, limit: int = 100,
+                          cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                          sort: Optional[str] = None) -> List[Row]:
         result = await self.session.execute(
-            select(Activity)
-            .options(selectinload(Activity.user))
-            .where(
-                Activity.organization_id == organization_id,
-                Activity.deal_id == deal_id
+            self.paginate(
+                self.apply_filters(
+                    select(*self.list_columns())
+                    .where(
+                        Activity.organization_id == organization_id,
+                        Activity.deal_id == deal_id
+                    ),
+                    filters
+                ),
+                skip,
+                limit,
+                cursor,
+                sort
             )
-            .order_by(Activity.created_at.desc())
         )
-        return list(result.scalars().all())
+        return list(result.all())
 
@@ -0,0 +1,153 @@
+from datetime import date, datetime, timedelta
+from statistics import median
+from typing import Dict, List
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, cast, Date, literal_column, tuple_
+
+from src.models.deal import Deal
+from src.models.task import Task
+from src.models.activity import Activity
+
+MAX_SERIES_DAYS = {"day": 366, "week": 728, "month": 3660}
+
+SERIES = {
+    "deals_created": (Deal, Deal.created_at, None, None),
+    "revenue_won": (Deal, Deal.closed_at, Deal.status == "closed", Deal.value),
+    "tasks_completed": (Task, Task.completed_at, Task.status == "completed", None),
+}
+
+
+def truncate(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def next_bucket(bucket: date, granularity: str) -> date:
+    if granularity == "week":
+        return bucket + timedelta(days=7)
+    if granularity == "month":
+        return (bucket.replace(day=28) + timedelta(days=4)).replace(day=1)
+    return bucket + timedelta(days=1)
+
+
+def series_buckets(start: date, end: date, granularity: str) -> List[date]:
+    buckets = []
+    bucket = truncate(start, granularity)
+    while bucket <= end:
+        buckets.append(bucket)
+        bucket = next_bucket(bucket, granularity)
+    return buckets
+
+
+class AnalyticsRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def bucket_expression(self, column, granularity: str):
+        if self.session.get_bind().dialect.name == "postgresql":
+            return cast(func.date_trunc(granularity, func.timezone("UTC", column)), Date)
+        if granularity == "week":
+            return func.date(column, literal_column("'-6 days'"), literal_column("'weekday 1'"))
+        if granularity == "month":
+            return func.strftime(literal_column("'%Y-%m-01'"), column)
+        return func.date(column)
+
+    async def get_series(self, organization_id: UUID, name: str, granularity: str,
+                         start: date, end: date) -> Dict[str, dict]:
+        model, column, condition, value = SERIES[name]
+        bucket = self.bucket_expression(column, granularity).label("bucket")
+        stmt = (
+            select(
+                bucket,
+                func.count(model.id).label("count"),
+                func.sum(value).label("value") if value is not None else literal_column("0").label("value")
+            )
+            .where(
+                model.organization_id == organization_id,
+                column >= datetime.combine(start, datetime.min.time()),
+                column < datetime.combine(end, datetime.min.time())
+            )
+            .group_by(bucket)
+        )
+        if condition is not None:
+            stmt = stmt.where(condition)
+        result = await self.session.execute(stmt)
+        return {
+            str(row.bucket): {"count": row.count, "value": float(row.value or 0)}
+            for row in result
+        }
+
+    def _transitions(self, organization_id: UUID):
+        window = {"partition_by": Activity.deal_id, "order_by": (Activity.created_at, Activity.id)}
+        return (
+            select(
+                Activity.to_stage.label("stage"),
+                func.lead(Activity.to_stage).over(**window).label("next_stage"),
+                Activity.created_at.label("entered_at"),
+                func.lead(Activity.created_at).over(**window).label("left_at")
+            )
+            .where(Activity.organization_id == organization_id, Activity.to_stage.is_not(None))
+            .subquery("transitions")
+        )
+
+    async def get_stage_transitions(self, organization_id: UUID) -> List[dict]:
+        transitions = self._transitions(organization_id)
+        if self.session.get_bind().dialect.name != "postgresql":
+            return await self._aggregate_transitions(transitions)
+        duration = func.extract("epoch", transitions.c.left_at - transitions.c.entered_at)
+        result = await self.session.execute(
+            select(
+                transitions.c.stage,
+                transitions.c.next_stage,
+                func.grouping(transitions.c.next_stage).label("is_total"),
+                func.count().label("count"),
+                func.count(transitions.c.next_stage).label("exited"),
+                func.percentile_cont(literal_column("0.5")).within_group(duration).label("median_seconds")
+            )
+            .group_by(
+                func.grouping_sets(
+                    tuple_(transitions.c.stage, transitions.c.next_stage),
+                    tuple_(transitions.c.stage)
+                )
+            )
+        )
+        return [
+            {
+                "stage": row.stage,
+                "to_stage": None if row.is_total else row.next_stage,
+                "count": row.count,
+                "exited": row.exited,
+                "median_seconds": float(row.median_seconds) if row.median_seconds is not None else None
+            }
+            for row in result
+            if row.is_total or row.next_stage is not None
+        ]
+
+    async def _aggregate_transitions(self, transitions) -> List[dict]:
+        duration = (func.julianday(transitions.c.left_at) - func.julianday(transitions.c.entered_at)) * 86400
+        result = await self.session.execute(
+            select(transitions.c.stage, transitions.c.next_stage, duration.label("duration"))
+        )
+        groups: Dict[tuple, dict] = {}
+        for row in result:
+            keys = [(row.stage, None)] + ([(row.stage, row.next_stage)] if row.next_stage is not None else [])
+            for key in keys:
+                group = groups.setdefault(key, {"count": 0, "exited": 0, "durations": []})
+                group["count"] += 1
+                if row.next_stage is not None:
+                    group["exited"] += 1
+                    group["durations"].append(row.duration)
+        return [
+            {
+                "stage": stage,
+                "to_stage": to_stage,
+                "count": group["count"],
+                "exited": group["exited"],
+                "median_seconds": median(group["durations"]) if group["durations"] else None
+            }
+            for (stage, to_stage), group in groups.items()
+        ]
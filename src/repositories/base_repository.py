@@ -1,20 +1,59 @@
-from typing import Generic, TypeVar, Type, Optional, List
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Dict, Generic, TypeVar, Type, Optional, List, Tuple
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, and_, or_, func, Select
 from sqlalchemy.orm import selectinload
 
 ModelType = TypeVar("ModelType")
+Cursor = Tuple[datetime, UUID]
+
+FILTER_OPERATORS = {
+    "eq": lambda column, value: column == value,
+    "in": lambda column, value: column.in_(value),
+    "gte": lambda column, value: column >= value,
+    "lte": lambda column, value: column <= value,
+}
+
+
+def encode_cursor(obj) -> str:
+    payload = json.dumps({"created_at": obj.created_at.isoformat(), "id": str(obj.id)})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["created_at"]), UUID(payload["id"])
+    except (binascii.Error, UnicodeDecodeError, TypeError, KeyError, ValueError):
+        raise ValueError("invalid cursor")
 
 
 class BaseRepository(Generic[ModelType]):
+    filter_fields: Dict[str, Tuple[str, ...]] = {}
+    sort_fields: Tuple[str, ...] = ("created_at",)
+    deferred_columns: Tuple[str, ...] = ()
+
     def __init__(self, model: Type[ModelType], session: AsyncSession):
         self.model = model
         self.session = session
 
-    async def get_by_id(self, id: UUID) -> Optional[ModelType]:
+    def list_columns(self) -> list:
+        return [column for column in self.model.__table__.columns if column.name not in self.deferred_columns]
+
+    async def get_by_id(self, id: UUID, for_update: bool = False) -> Optional[ModelType]:
+        stmt = select(self.model).where(self.model.id == id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_updated_at(self, organization_id: UUID, id: UUID) -> Optional[datetime]:
         result = await self.session.execute(
-            select(self.model).where(self.model.id == id)
+            select(self.model.updated_at).where(self.model.id == id, self.model.organization_id == organization_id)
         )
         return result.scalar_one_or_none()
 
@@ -24,23 +63,82 @@ class BaseRepository(Generic[ModelType]):
         )
         return list(result.scalars().all())
 
+    def apply_filters(self, stmt: Select, filters: Optional[dict] = None) -> Select:
+        for key, value in (filters or {}).items():
+            if value is None:
+                continue
+            field, _, operator = key.partition("__")
+            operator = operator or "eq"
+            if operator not in self.filter_fields.get(field, ()):
+                raise ValueError(f"unsupported filter: {key}")
+            stmt = stmt.where(FILTER_OPERATORS[operator](getattr(self.model, field), value))
+        return stmt
+
+    def apply_sort(self, stmt: Select, sort: str) -> Select:
+        field = sort.lstrip("-")
+        if field not in self.sort_fields:
+            raise ValueError(f"unsupported sort: {sort}")
+        column = getattr(self.model, field)
+        if sort.startswith("-"):
+            return stmt.order_by(column.desc().nulls_last(), self.model.id.desc())
+        return stmt.order_by(column.asc().nulls_last(), self.model.id.asc())
+
+    def paginate(self, stmt: Select, skip: int = 0, limit: int = 100, cursor: Optional[Cursor] = None,
+                 sort: Optional[str] = None) -> Select:
+        if sort is not None:
+            if cursor is not None:
+                raise ValueError("cursor pagination does not support custom sort")
+            return self.apply_sort(stmt, sort).offset(skip).limit(limit)
+        stmt = stmt.order_by(self.model.created_at.desc(), self.model.id.desc())
+        if cursor is None:
+            return stmt.offset(skip).limit(limit)
+        created_at, id = cursor
+        anchor = func.coalesce(
+            select(self.model.created_at).where(self.model.id == id).scalar_subquery(),
+            created_at
+        )
+        return stmt.where(
+            or_(
+                self.model.created_at < anchor,
+                and_(self.model.created_at == anchor, self.model.id < id)
+            )
+        ).limit(limit)
+
     async def create(self, obj: ModelType) -> ModelType:
         self.session.add(obj)
-        await self.session.commit()
-        await self.session.refresh(obj)
+        await self.session.flush()
         return obj
 
     async def update(self, id: UUID, **kwargs) -> Optional[ModelType]:
-        await self.session.execute(
-            update(self.model).where(self.model.id == id).values(**kwargs)
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**kwargs)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
         )
-        await self.session.commit()
-        return await self.get_by_id(id)
+        return result.scalar_one_or_none()
+
+    async def get_by_ids(self, organization_id: UUID, ids: List[UUID], for_update: bool = False) -> List[ModelType]:
+        stmt = select(self.model).where(self.model.id.in_(ids), self.model.organization_id == organization_id)
+        if for_update:
+            stmt = stmt.with_for_update()
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def update_many(self, organization_id: UUID, ids: List[UUID], *criteria, **kwargs) -> List[ModelType]:
+        result = await self.session.execute(
+            update(self.model)
+            .where(self.model.id.in_(ids), self.model.organization_id == organization_id, *criteria)
+            .values(**kwargs)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
 
     async def delete(self, id: UUID) -> bool:
-        await self.session.execute(
+        result = await self.session.execute(
             delete(self.model).where(self.model.id == id)
         )
-        await self.session.commit()
-        return True
+        return result.rowcount > 0
 
@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from src.models.contact_import_job import ContactImportJob
+from src.repositories.base_repository import BaseRepository
+
+
+class ContactImportJobRepository(BaseRepository[ContactImportJob]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(ContactImportJob, session)
+
+    async def get_for_organization(self, organization_id: UUID, job_id: UUID) -> Optional[ContactImportJob]:
+        result = await self.session.execute(
+            select(ContactImportJob).where(
+                ContactImportJob.id == job_id,
+                ContactImportJob.organization_id == organization_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def fail_stale(self, updated_before: datetime) -> int:
+        result = await self.session.execute(
+            update(ContactImportJob)
+            .where(
+                ContactImportJob.status.in_(("pending", "running")),
+                ContactImportJob.updated_at < updated_before
+            )
+            .values(status="failed")
+        )
+        return result.rowcount
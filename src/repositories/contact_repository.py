@@ -1,22 +1,75 @@
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, literal_column, Row
 
-from src.models.contact import Contact
-from src.repositories.base_repository import BaseRepository
+from src.models.contact import Contact, contact_search_vector
+from src.repositories.base_repository import BaseRepository, Cursor
+from src.search import contact_search_index, tokenize
 
 
 class ContactRepository(BaseRepository[Contact]):
+    filter_fields = {
+        "company": ("eq",),
+        "created_at": ("gte", "lte"),
+    }
+    sort_fields = ("created_at", "name")
+    deferred_columns = ("notes",)
+
     def __init__(self, session: AsyncSession):
         super().__init__(Contact, session)
 
-    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[Contact]:
+    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100,
+                                  cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                                  sort: Optional[str] = None) -> List[Row]:
+        result = await self.session.execute(
+            self.paginate(
+                self.apply_filters(
+                    select(*self.list_columns())
+                    .where(Contact.organization_id == organization_id),
+                    filters
+                ),
+                skip,
+                limit,
+                cursor,
+                sort
+            )
+        )
+        return list(result.all())
+
+    async def search(self, organization_id: UUID, query: str, limit: int = 20) -> List[Contact]:
+        if self.session.get_bind().dialect.name == "postgresql":
+            return await self._search_fulltext(organization_id, query, limit)
+        return await self._search_ngram(organization_id, query, limit)
+
+    async def _search_fulltext(self, organization_id: UUID, query: str, limit: int) -> List[Contact]:
+        terms = tokenize(query)
+        if not terms:
+            return []
+        tsquery = func.to_tsquery(
+            literal_column("'simple'::regconfig"),
+            " & ".join(f"{term}:*" for term in terms)
+        )
+        vector = contact_search_vector(Contact.name, Contact.email, Contact.phone, Contact.company)
         result = await self.session.execute(
             select(Contact)
-            .where(Contact.organization_id == organization_id)
-            .offset(skip)
+            .where(Contact.organization_id == organization_id, vector.op("@@")(tsquery))
+            .order_by(func.ts_rank(vector, tsquery).desc(), Contact.name, Contact.id)
             .limit(limit)
         )
         return list(result.scalars().all())
 
+    async def _search_ngram(self, organization_id: UUID, query: str, limit: int) -> List[Contact]:
+        index = contact_search_index.get(organization_id)
+        if index is None:
+            result = await self.session.execute(
+                select(Contact.id, Contact.name, Contact.email, Contact.phone, Contact.company)
+                .where(Contact.organization_id == organization_id)
+            )
+            index = contact_search_index.build(organization_id, result.all())
+        ids = index.search(query, limit)
+        if not ids:
+            return []
+        result = await self.session.execute(select(Contact).where(Contact.id.in_(ids)))
+        contacts = {contact.id: contact for contact in result.scalars().all()}
+        return [contacts[contact_id] for contact_id in ids if contact_id in contacts]
@@ -1,65 +1,69 @@
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, Row
 
 from src.models.deal import Deal
-from src.repositories.base_repository import BaseRepository
+from src.repositories.base_repository import BaseRepository, Cursor
+
+FUNNEL_STAGES = ["new", "qualification", "proposal", "negotiation", "closed"]
 
 
 class DealRepository(BaseRepository[Deal]):
+    filter_fields = {
+        "stage": ("eq", "in"),
+        "status": ("eq", "in"),
+        "contact_id": ("eq",),
+        "value": ("gte", "lte"),
+        "created_at": ("gte", "lte"),
+    }
+    sort_fields = ("created_at", "updated_at", "value", "title")
+    deferred_columns = ("notes",)
+
     def __init__(self, session: AsyncSession):
         super().__init__(Deal, session)
 
-    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[Deal]:
-        result = await self.session.execute(
-            select(Deal)
-            .options(selectinload(Deal.contact))
-            .where(Deal.organization_id == organization_id)
-            .offset(skip)
-            .limit(limit)
-        )
-        return list(result.scalars().all())
-
-    async def get_by_stage(self, organization_id: UUID, stage: str) -> List[Deal]:
+    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100,
+                                  cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                                  sort: Optional[str] = None) -> List[Row]:
         result = await self.session.execute(
-            select(Deal).where(
-                Deal.organization_id == organization_id,
-                Deal.stage == stage
+            self.paginate(
+                self.apply_filters(
+                    select(*self.list_columns())
+                    .where(Deal.organization_id == organization_id),
+                    filters
+                ),
+                skip,
+                limit,
+                cursor,
+                sort
             )
         )
-        return list(result.scalars().all())
+        return list(result.all())
 
-    async def get_summary(self, organization_id: UUID) -> dict:
-        result = await self.session.execute(
-            select(
-                func.count(Deal.id).label("total"),
-                func.sum(Deal.value).label("total_value"),
-                func.avg(Deal.value).label("avg_value")
-            ).where(
-                Deal.organization_id == organization_id,
-                Deal.status == "closed"
-            )
-        )
-        row = result.first()
-        return {
-            "total": row.total or 0,
-            "total_value": float(row.total_value or 0),
-            "avg_value": float(row.avg_value or 0)
-        }
+    async def get_by_stage(self, organization_id: UUID, stage: str, limit: int = 100) -> List[Row]:
+        return await self.get_by_organization(organization_id, limit=limit, filters={"stage": stage})
 
-    async def get_funnel(self, organization_id: UUID) -> dict:
-        stages = ["new", "qualification", "proposal", "negotiation", "closed"]
-        funnel = {}
-        for stage in stages:
-            result = await self.session.execute(
-                select(func.count(Deal.id)).where(
-                    Deal.organization_id == organization_id,
-                    Deal.stage == stage
-                )
-            )
-            count = result.scalar() or 0
-            funnel[stage] = count
-        return funnel
 
+def build_overview(stats: List[dict]) -> dict:
+    stages = {stage: {"stage": stage, "count": 0, "total_value": 0.0} for stage in FUNNEL_STAGES}
+    closed_count = 0
+    closed_valued = 0
+    closed_value = 0.0
+    for row in stats:
+        stage = stages.setdefault(row["stage"], {"stage": row["stage"], "count": 0, "total_value": 0.0})
+        stage["count"] += row["count"]
+        stage["total_value"] += row["total_value"]
+        if row["status"] == "closed":
+            closed_count += row["count"]
+            closed_valued += row["valued_count"]
+            closed_value += row["total_value"]
+    extra = sorted(stage for stage in stages if stage not in FUNNEL_STAGES)
+    return {
+        "summary": {
+            "total": closed_count,
+            "total_value": closed_value,
+            "avg_value": closed_value / closed_valued if closed_valued else 0.0
+        },
+        "stages": [stages[stage] for stage in FUNNEL_STAGES + extra]
+    }
@@ -0,0 +1,98 @@
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, insert, func, literal, text, union
+from sqlalchemy.dialects import postgresql, sqlite
+
+from src.models.deal import Deal
+from src.models.deal_stat import DealStat
+
+DealKey = Tuple[str, str]
+
+
+class DealStatRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_stage_stats(self, organization_id: UUID) -> List[dict]:
+        result = await self.session.execute(
+            select(DealStat)
+            .where(DealStat.organization_id == organization_id, DealStat.count > 0)
+        )
+        return [
+            {
+                "stage": stat.stage,
+                "status": stat.status,
+                "count": stat.count,
+                "valued_count": stat.valued_count,
+                "total_value": float(stat.total_value or 0)
+            }
+            for stat in result.scalars()
+        ]
+
+    async def apply_deltas(self, organization_id: UUID, deltas: List[Tuple[DealKey, int, Optional[Decimal]]]) -> None:
+        merged: Dict[DealKey, list] = {}
+        for key, sign, value in deltas:
+            row = merged.setdefault(key, [0, 0, Decimal(0)])
+            row[0] += sign
+            if value is not None:
+                row[1] += sign
+                row[2] += sign * Decimal(str(value))
+        rows = [
+            {
+                "organization_id": organization_id,
+                "stage": stage,
+                "status": status,
+                "count": count,
+                "valued_count": valued_count,
+                "total_value": total_value
+            }
+            for (stage, status), (count, valued_count, total_value) in merged.items()
+            if count or valued_count or total_value
+        ]
+        if not rows:
+            return
+        dialect = postgresql if self.session.get_bind().dialect.name == "postgresql" else sqlite
+        stmt = dialect.insert(DealStat).values(rows)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[DealStat.organization_id, DealStat.stage, DealStat.status],
+                set_={
+                    "count": DealStat.count + stmt.excluded.count,
+                    "valued_count": DealStat.valued_count + stmt.excluded.valued_count,
+                    "total_value": DealStat.total_value + stmt.excluded.total_value
+                }
+            )
+        )
+
+    async def rebuild(self, organization_id: Optional[UUID] = None) -> List[UUID]:
+        stats = delete(DealStat)
+        deals = select(
+            Deal.organization_id,
+            Deal.stage,
+            Deal.status,
+            func.count(Deal.id),
+            func.count(Deal.value),
+            func.coalesce(func.sum(Deal.value), literal(0))
+        ).group_by(Deal.organization_id, Deal.stage, Deal.status)
+        if organization_id is not None:
+            stats = stats.where(DealStat.organization_id == organization_id)
+            deals = deals.where(Deal.organization_id == organization_id)
+        if self.session.get_bind().dialect.name == "postgresql":
+            await self.session.execute(text("LOCK TABLE deal_stats IN EXCLUSIVE MODE"))
+        if organization_id is None:
+            result = await self.session.execute(
+                union(select(DealStat.organization_id), select(Deal.organization_id))
+            )
+            organization_ids = list(result.scalars())
+        else:
+            organization_ids = [organization_id]
+        await self.session.execute(stats)
+        await self.session.execute(
+            insert(DealStat).from_select(
+                ["organization_id", "stage", "status", "count", "valued_count", "total_value"],
+                deals
+            )
+        )
+        return organization_ids
@@ -1,33 +1,92 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, func, Row
 
-from src.models.task import Task
-from src.repositories.base_repository import BaseRepository
+from src.models.task import Task, open_task
+from src.repositories.base_repository import BaseRepository, Cursor
 
 
 class TaskRepository(BaseRepository[Task]):
+    filter_fields = {
+        "status": ("eq", "in"),
+        "assigned_to_id": ("eq",),
+        "deal_id": ("eq",),
+        "contact_id": ("eq",),
+        "due_date": ("gte", "lte"),
+        "created_at": ("gte", "lte"),
+    }
+    sort_fields = ("created_at", "due_date", "title")
+
     def __init__(self, session: AsyncSession):
         super().__init__(Task, session)
 
-    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100) -> List[Task]:
+    async def get_by_organization(self, organization_id: UUID, skip: int = 0, limit: int = 100,
+                                  cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                                  sort: Optional[str] = None) -> List[Row]:
         result = await self.session.execute(
-            select(Task)
-            .options(selectinload(Task.assigned_to))
-            .where(Task.organization_id == organization_id)
-            .offset(skip)
-            .limit(limit)
+            self.paginate(
+                self.apply_filters(
+                    select(*self.list_columns())
+                    .where(Task.organization_id == organization_id),
+                    filters
+                ),
+                skip,
+                limit,
+                cursor,
+                sort
+            )
+        )
+        return list(result.all())
+
+    async def get_by_user(self, organization_id: UUID, user_id: UUID, limit: int = 100) -> List[Row]:
+        return await self.get_by_organization(organization_id, limit=limit, filters={"assigned_to_id": user_id})
+
+    async def get_open_by_due_date(self, organization_id: UUID, due_after: Optional[datetime] = None,
+                                   due_before: Optional[datetime] = None, assigned_to_id: Optional[UUID] = None,
+                                   limit: int = 100) -> List[Row]:
+        stmt = select(*self.list_columns()).where(
+            Task.organization_id == organization_id,
+            open_task(Task.status),
+            Task.due_date.is_not(None)
         )
-        return list(result.scalars().all())
+        if due_after is not None:
+            stmt = stmt.where(Task.due_date >= due_after)
+        if due_before is not None:
+            stmt = stmt.where(Task.due_date < due_before)
+        if assigned_to_id is not None:
+            stmt = stmt.where(Task.assigned_to_id == assigned_to_id)
+        result = await self.session.execute(stmt.order_by(Task.due_date, Task.id).limit(limit))
+        return list(result.all())
 
-    async def get_by_user(self, organization_id: UUID, user_id: UUID) -> List[Task]:
+    async def count_overdue(self, organization_id: UUID, now: datetime) -> int:
         result = await self.session.execute(
-            select(Task).where(
+            select(func.count(Task.id)).where(
                 Task.organization_id == organization_id,
-                Task.assigned_to_id == user_id
+                open_task(Task.status),
+                Task.due_date < now
             )
         )
-        return list(result.scalars().all())
+        return result.scalar_one()
 
+    async def claim_overdue(self, now: datetime, limit: int) -> List[Row]:
+        candidates = (
+            select(Task.id)
+            .where(
+                open_task(Task.status),
+                Task.overdue_notified_at.is_(None),
+                Task.due_date < now
+            )
+            .order_by(Task.due_date)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.execute(
+            update(Task)
+            .where(Task.id.in_(candidates.scalar_subquery()))
+            .values(overdue_notified_at=now)
+            .returning(Task.id, Task.organization_id, Task.assigned_to_id, Task.title)
+            .execution_options(synchronize_session=False)
+        )
+        return list(result.all())
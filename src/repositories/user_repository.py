@@ -5,6 +5,7 @@ from sqlalchemy import select
 
 from src.models.user import User
 from src.repositories.base_repository import BaseRepository
+from src.cache import user_cache
 
 
 class UserRepository(BaseRepository[User]):
@@ -17,3 +18,11 @@ class UserRepository(BaseRepository[User]):
         )
         return result.scalar_one_or_none()
 
+
+    async def update(self, id: UUID, **kwargs) -> Optional[User]:
+        user_cache.delete(str(id))
+        return await super().update(id, **kwargs)
+
+    async def delete(self, id: UUID) -> bool:
+        user_cache.delete(str(id))
+        return await super().delete(id)
@@ -0,0 +1,121 @@
+import re
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from src.config import app_settings
+
+TOKEN_PATTERN = re.compile(r"\w+(?:[.\-]\w+)*")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    return [token.lower() for token in TOKEN_PATTERN.findall(text or "")]
+
+
+def ngrams(text: str, size: int = 3) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def word_ngrams(word: str) -> Set[str]:
+    return ngrams("  " + word)
+
+
+def query_ngrams(token: str) -> Set[str]:
+    if len(token) < 3:
+        return {("  " + token)[-3:]}
+    return ngrams(token)
+
+
+class OrganizationSearchIndex:
+    def __init__(self):
+        self.documents: Dict[UUID, Tuple[str, str, List[str]]] = {}
+        self.postings: Dict[str, Set[UUID]] = {}
+
+    def add(self, contact_id: UUID, name: str, fields: Iterable[Optional[str]]) -> None:
+        self.remove(contact_id)
+        text = " ".join(field for field in fields if field).lower()
+        words = WORD_PATTERN.findall(text)
+        self.documents[contact_id] = ((name or "").lower(), text, words)
+        for word in words:
+            for gram in word_ngrams(word):
+                self.postings.setdefault(gram, set()).add(contact_id)
+
+    def remove(self, contact_id: UUID) -> None:
+        document = self.documents.pop(contact_id, None)
+        if document is None:
+            return
+        for word in document[2]:
+            for gram in word_ngrams(word):
+                ids = self.postings.get(gram)
+                if ids is not None:
+                    ids.discard(contact_id)
+                    if not ids:
+                        del self.postings[gram]
+
+    def search(self, query: str, limit: int) -> List[UUID]:
+        tokens = WORD_PATTERN.findall(query.lower())
+        if not tokens:
+            return []
+        grams = set().union(*(query_ngrams(token) for token in tokens))
+        posting_lists = sorted((self.postings.get(gram, set()) for gram in grams), key=len)
+        candidates = set(posting_lists[0])
+        for ids in posting_lists[1:]:
+            candidates &= ids
+            if not candidates:
+                return []
+        scored = []
+        for contact_id in candidates:
+            name, text, words = self.documents[contact_id]
+            score = 0
+            for token in tokens:
+                if any(word.startswith(token) for word in words):
+                    score += 2
+                elif len(token) >= 3 and token in text:
+                    score += 1
+                else:
+                    break
+            else:
+                scored.append((-score, name, str(contact_id), contact_id))
+        scored.sort()
+        return [item[3] for item in scored[:limit]]
+
+
+class ContactSearchIndex:
+    def __init__(self, max_organizations: int = 256):
+        self.max_organizations = max_organizations
+        self._organizations: "OrderedDict[UUID, OrganizationSearchIndex]" = OrderedDict()
+
+    def get(self, organization_id: UUID) -> Optional[OrganizationSearchIndex]:
+        index = self._organizations.get(organization_id)
+        if index is not None:
+            self._organizations.move_to_end(organization_id)
+        return index
+
+    def build(self, organization_id: UUID, rows: Iterable[tuple]) -> OrganizationSearchIndex:
+        index = OrganizationSearchIndex()
+        for contact_id, name, *fields in rows:
+            index.add(contact_id, name, [name, *fields])
+        self._organizations[organization_id] = index
+        while len(self._organizations) > self.max_organizations:
+            self._organizations.popitem(last=False)
+        return index
+
+    def upsert(self, contact) -> None:
+        index = self._organizations.get(contact.organization_id)
+        if index is not None:
+            index.add(contact.id, contact.name, [contact.name, contact.email, contact.phone, contact.company])
+
+    def remove(self, organization_id: UUID, contact_id: UUID) -> None:
+        index = self._organizations.get(organization_id)
+        if index is not None:
+            index.remove(contact_id)
+
+    def invalidate(self, organization_id: UUID) -> None:
+        self._organizations.pop(organization_id, None)
+
+    def clear(self) -> None:
+        self._organizations.clear()
+
+
+contact_search_index = ContactSearchIndex(app_settings.contact_search_index_max_organizations)
@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import uuid4
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import app_settings
+from src.cache import analytics_cache
+from src.models.activity import Activity
+from src.repositories.activity_repository import ActivityRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityWriter:
+    def __init__(self, batch_size: int = 500, flush_interval_ms: int = 50, max_queue_size: int = 10000):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue_size = max_queue_size
+        self.session_maker: Optional[async_sessionmaker] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.written = 0
+        self.batches = 0
+        self.failed = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, session_maker: async_sessionmaker) -> None:
+        if self.running:
+            return
+        self.session_maker = session_maker
+        self._queue = asyncio.Queue(self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        await self._queue.put(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, rows: List[dict]) -> None:
+        if not self.running:
+            await self._write(rows)
+            return
+        for row in rows:
+            await self._queue.put(row)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            row = await self._queue.get()
+            if row is None:
+                break
+            batch = [row]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+            await self._write(batch)
+
+    async def _write(self, rows: List[dict]) -> None:
+        try:
+            async with self.session_maker() as session:
+                await session.execute(insert(Activity), rows)
+                await session.commit()
+        except Exception:
+            self.failed += len(rows)
+            logger.exception("failed to write %d activities", len(rows))
+            return
+        stage_changed = {row["organization_id"] for row in rows if row.get("to_stage") is not None}
+        for organization_id in {row["organization_id"] for row in rows}:
+            if organization_id in stage_changed:
+                await analytics_cache.invalidate(organization_id)
+            else:
+                await analytics_cache.touch(organization_id)
+        self.written += len(rows)
+        self.batches += 1
+
+    def stats(self) -> dict:
+        return {
+            "running": self.running,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "written": self.written,
+            "batches": self.batches,
+            "failed": self.failed
+        }
+
+
+class ActivityRecorder:
+    def __init__(self, session: AsyncSession, durable: Optional[bool] = None):
+        self.session = session
+        self.activity_repo = ActivityRepository(session)
+        self.durable = app_settings.activity_log_mode == "durable" if durable is None else durable
+        self.pending: List[dict] = []
+
+    async def add(self, **values) -> None:
+        values.setdefault("created_at", datetime.now(timezone.utc))
+        if self.durable or not activity_writer.running:
+            await self.activity_repo.create(Activity(**values))
+            return
+        self.pending.append({"id": uuid4(), **values})
+
+    async def add_many(self, rows: List[dict]) -> None:
+        created_at = datetime.now(timezone.utc)
+        rows = [{"id": uuid4(), "created_at": created_at, **row} for row in rows]
+        if not rows:
+            return
+        if self.durable or not activity_writer.running:
+            await self.session.execute(insert(Activity), rows)
+            return
+        self.pending.extend(rows)
+
+    async def publish(self) -> None:
+        rows, self.pending = self.pending, []
+        if rows:
+            await activity_writer.submit(rows)
+
+
+activity_writer = ActivityWriter(
+    app_settings.activity_batch_size,
+    app_settings.activity_flush_interval_ms,
+    app_settings.activity_queue_max_size
+)
@@ -1,38 +1,114 @@
+from datetime import date, datetime, timezone
 from typing import Optional
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repositories.deal_repository import DealRepository
+from src.repositories.deal_stat_repository import DealStatRepository
+from src.repositories.deal_repository import FUNNEL_STAGES, build_overview
+from src.repositories.analytics_repository import AnalyticsRepository, next_bucket, series_buckets, truncate
 from src.repositories.organization_member_repository import OrganizationMemberRepository
-
-
-cache = {}
+from src.services.request_context import RequestContext, resolve_member
+from src.cache import analytics_cache
 
 
 class AnalyticsService:
-    def __init__(self, session: AsyncSession):
-        self.deal_repo = DealRepository(session)
+    def __init__(self, session: AsyncSession, context: Optional[RequestContext] = None):
+        self.context = context
+        self.deal_stat_repo = DealStatRepository(session)
+        self.analytics_repo = AnalyticsRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
 
-    async def get_deals_summary(self, organization_id: UUID, user_id: UUID) -> dict:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+    async def get_deals_overview(self, organization_id: UUID, user_id: UUID) -> dict:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
-        cache_key = f"deals_summary_{organization_id}"
-        if cache_key in cache:
-            return cache[cache_key]
-        summary = await self.deal_repo.get_summary(organization_id)
-        cache[cache_key] = summary
-        return summary
+        return await analytics_cache.get_or_compute(
+            organization_id,
+            "deals_overview",
+            lambda: self._compute_overview(organization_id)
+        )
 
-    async def get_deals_funnel(self, organization_id: UUID, user_id: UUID) -> dict:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+    async def _compute_overview(self, organization_id: UUID) -> dict:
+        return build_overview(await self.deal_stat_repo.get_stage_stats(organization_id))
+
+    async def get_stage_conversion(self, organization_id: UUID, user_id: UUID) -> dict:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
-        cache_key = f"deals_funnel_{organization_id}"
-        if cache_key in cache:
-            return cache[cache_key]
-        funnel = await self.deal_repo.get_funnel(organization_id)
-        cache[cache_key] = funnel
-        return funnel
+        return await analytics_cache.get_or_compute(
+            organization_id,
+            "stage_conversion",
+            lambda: self._compute_stage_conversion(organization_id)
+        )
+
+    async def _compute_stage_conversion(self, organization_id: UUID) -> dict:
+        rows = await self.analytics_repo.get_stage_transitions(organization_id)
+        stages = {
+            row["stage"]: {
+                "stage": row["stage"],
+                "entered": row["count"],
+                "exited": row["exited"],
+                "median_seconds": row["median_seconds"],
+                "conversions": []
+            }
+            for row in rows if row["to_stage"] is None
+        }
+        for row in sorted(rows, key=lambda row: -row["count"]):
+            if row["to_stage"] is not None:
+                stage = stages[row["stage"]]
+                stage["conversions"].append({
+                    "to_stage": row["to_stage"],
+                    "count": row["count"],
+                    "rate": row["count"] / stage["entered"],
+                    "median_seconds": row["median_seconds"]
+                })
+        order = FUNNEL_STAGES + sorted(stage for stage in stages if stage not in FUNNEL_STAGES)
+        return {"stages": [stages[stage] for stage in order if stage in stages]}
 
+    async def get_deals_summary(self, organization_id: UUID, user_id: UUID) -> dict:
+        overview = await self.get_deals_overview(organization_id, user_id)
+        return overview["summary"]
+
+    async def get_deals_funnel(self, organization_id: UUID, user_id: UUID) -> dict:
+        overview = await self.get_deals_overview(organization_id, user_id)
+        return {stage["stage"]: stage["count"] for stage in overview["stages"]}
+
+    async def get_time_series(self, organization_id: UUID, user_id: UUID, name: str, granularity: str,
+                              start: date, end: date) -> dict:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        current = truncate(datetime.now(timezone.utc).date(), granularity)
+        buckets = series_buckets(start, end, granularity)
+        cache_name = f"{name}:{granularity}"
+        version, cached = await analytics_cache.get_history(
+            organization_id,
+            cache_name,
+            [bucket.isoformat() for bucket in buckets if bucket < current]
+        )
+        missing = [bucket for bucket in buckets if bucket.isoformat() not in cached]
+        computed = {}
+        if missing:
+            computed = await self.analytics_repo.get_series(
+                organization_id,
+                name,
+                granularity,
+                missing[0],
+                next_bucket(missing[-1], granularity)
+            )
+            empty = {"count": 0, "value": 0.0}
+            await analytics_cache.set_history(
+                organization_id,
+                cache_name,
+                version,
+                {
+                    bucket.isoformat(): computed.get(bucket.isoformat(), empty)
+                    for bucket in missing if bucket < current
+                }
+            )
+        points = []
+        for bucket in buckets:
+            key = bucket.isoformat()
+            point = cached.get(key) or computed.get(key) or {"count": 0, "value": 0.0}
+            points.append({"bucket": bucket, **point})
+        return {"granularity": granularity, "points": points}
@@ -1,3 +1,5 @@
+import hashlib
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 from uuid import UUID
@@ -9,23 +11,20 @@ from src.config import app_settings
 from src.repositories.user_repository import UserRepository
 from src.repositories.organization_member_repository import OrganizationMemberRepository
 from src.models.user import User
+from src.services.password_hasher import PasswordHasher
+from src.services.request_context import CurrentUser
+from src.cache import token_cache, user_cache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+password_hasher = PasswordHasher(pwd_context, app_settings.password_hash_workers)
 
 
 class AuthService:
     def __init__(self, session: AsyncSession):
+        self.session = session
         self.user_repo = UserRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
 
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
-
-    @staticmethod
-    def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
-
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
         to_encode = data.copy()
@@ -53,19 +52,44 @@ class AuthService:
         except JWTError:
             return None
 
+    def decode_token_cached(self, token: str) -> Optional[dict]:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        payload = token_cache.get(key)
+        if payload is not None:
+            return payload
+        payload = self.decode_token(token)
+        if payload and "exp" in payload:
+            ttl = payload["exp"] - time.time()
+            if ttl > 0:
+                token_cache.set(key, payload, ttl)
+        return payload
+
+    async def get_user_cached(self, user_id: UUID) -> Optional[CurrentUser]:
+        user = user_cache.get(str(user_id))
+        if user is not None:
+            return user
+        model = await self.user_repo.get_by_id(user_id)
+        if model is None:
+            return None
+        user = CurrentUser.from_model(model)
+        user_cache.set(str(user_id), user)
+        return user
+
     async def register_user(self, email: str, password: str, full_name: str) -> User:
         existing = await self.user_repo.get_by_email(email)
         if existing:
             raise ValueError("user already exists")
-        hashed = self.get_password_hash(password)
+        hashed = await password_hasher.hash(password)
         user = User(email=email, password_hash=hashed, full_name=full_name)
-        return await self.user_repo.create(user)
+        user = await self.user_repo.create(user)
+        await self.session.commit()
+        return user
 
     async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         user = await self.user_repo.get_by_email(email)
         if not user:
             return None
-        if not self.verify_password(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return None
         return user
 
@@ -0,0 +1,187 @@
+import csv
+import io
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+from uuid import UUID, uuid4
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import app_settings
+from src.cache import analytics_cache
+from src.models.contact import Contact
+from src.models.contact_import_job import ContactImportJob
+from src.repositories.contact_import_job_repository import ContactImportJobRepository
+from src.api.v1.schemas import ContactCreate
+from src.search import contact_search_index
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+MAX_REPORTED_ERRORS = 100
+
+
+@dataclass
+class ImportJob:
+    organization_id: UUID
+    user_id: UUID
+    format: str
+    bytes_total: int = 0
+    id: UUID = field(default_factory=uuid4)
+    status: str = "pending"
+    bytes_processed: int = 0
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[dict] = field(default_factory=list)
+
+    def add_error(self, row: int, error: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"row": row, "error": error})
+
+
+    def progress(self) -> dict:
+        return {
+            "status": self.status,
+            "bytes_processed": self.bytes_processed,
+            "processed": self.processed,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": list(self.errors),
+        }
+
+
+async def register_job(session: AsyncSession, job: ImportJob) -> ContactImportJob:
+    record = await ContactImportJobRepository(session).create(ContactImportJob(
+        id=job.id,
+        organization_id=job.organization_id,
+        user_id=job.user_id,
+        format=job.format,
+        bytes_total=job.bytes_total,
+        **job.progress()
+    ))
+    await session.commit()
+    return record
+
+
+async def get_job(session: AsyncSession, organization_id: UUID, job_id: UUID) -> Optional[ContactImportJob]:
+    return await ContactImportJobRepository(session).get_for_organization(organization_id, job_id)
+
+
+async def save_job(session: AsyncSession, job: ImportJob) -> None:
+    await ContactImportJobRepository(session).update(job.id, **job.progress())
+
+
+async def fail_stale_jobs(session_maker: async_sessionmaker, stale_after_seconds: Optional[int] = None) -> int:
+    stale_after_seconds = stale_after_seconds or app_settings.contact_import_stale_seconds
+    updated_before = datetime.now(timezone.utc) - timedelta(seconds=stale_after_seconds)
+    async with session_maker() as session:
+        count = await ContactImportJobRepository(session).fail_stale(updated_before)
+        await session.commit()
+    if count:
+        logger.warning("marked %d stale contact import jobs as failed", count)
+    return count
+
+
+def detect_format(format: Optional[str], filename: Optional[str]) -> str:
+    if format is None and filename:
+        extension = os.path.splitext(filename)[1].lower()
+        format = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}.get(extension)
+    if format not in IMPORT_FORMATS:
+        raise ValueError("unsupported import format")
+    return format
+
+
+class ContactImportService:
+    def __init__(self, session_maker: async_sessionmaker, batch_size: Optional[int] = None):
+        self.session_maker = session_maker
+        self.batch_size = batch_size or app_settings.contact_import_batch_size
+
+    async def run(self, job: ImportJob, path: str) -> None:
+        job.status = "running"
+        rows = self._read_rows(job, path)
+        try:
+            async with self.session_maker() as session:
+                await save_job(session, job)
+                await session.commit()
+                while batch := await run_in_threadpool(self._next_batch, job, rows):
+                    await self._insert(session, job, batch)
+                job.status = "completed"
+                await save_job(session, job)
+                await session.commit()
+        except Exception as e:
+            job.status = "failed"
+            job.add_error(job.processed, str(e))
+            async with self.session_maker() as session:
+                await save_job(session, job)
+                await session.commit()
+        finally:
+            rows.close()
+            os.remove(path)
+
+    def _next_batch(self, job: ImportJob, rows: Iterator[Tuple[int, object]]) -> List[dict]:
+        batch = []
+        for row_number, row in rows:
+            job.processed += 1
+            values = self._validate(job, row_number, row)
+            if values is None:
+                continue
+            batch.append(values)
+            if len(batch) >= self.batch_size:
+                break
+        return batch
+
+    def _read_rows(self, job: ImportJob, path: str) -> Iterator[Tuple[int, object]]:
+        with open(path, "rb") as raw:
+            lines = self._track(job, raw)
+            if job.format == "csv":
+                for row_number, row in enumerate(csv.DictReader(lines), start=1):
+                    yield row_number, row
+            else:
+                for row_number, line in enumerate(lines, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield row_number, json.loads(line)
+                    except json.JSONDecodeError as e:
+                        yield row_number, e
+
+    @staticmethod
+    def _track(job: ImportJob, raw: io.BufferedReader) -> Iterator[str]:
+        for line in raw:
+            job.bytes_processed += len(line)
+            yield line.decode("utf-8-sig" if job.bytes_processed == len(line) else "utf-8")
+
+    @staticmethod
+    def _validate(job: ImportJob, row_number: int, row: object) -> Optional[dict]:
+        if isinstance(row, Exception):
+            job.add_error(row_number, f"invalid json: {row}")
+            return None
+        if not isinstance(row, dict):
+            job.add_error(row_number, "row must be an object")
+            return None
+        if job.format == "csv":
+            row = {key: value or None for key, value in row.items() if key}
+        try:
+            contact = ContactCreate.model_validate(row)
+        except ValidationError as e:
+            job.add_error(row_number, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in e.errors()
+            ))
+            return None
+        return {"organization_id": job.organization_id, **contact.model_dump()}
+
+    @staticmethod
+    async def _insert(session: AsyncSession, job: ImportJob, batch: List[dict]) -> None:
+        await session.execute(insert(Contact), batch)
+        job.imported += len(batch)
+        await save_job(session, job)
+        await session.commit()
+        contact_search_index.invalidate(job.organization_id)
+        await analytics_cache.touch(job.organization_id)
@@ -1,21 +1,28 @@
 from typing import List, Optional
 from uuid import UUID
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.contact_repository import ContactRepository
+from src.repositories.base_repository import Cursor
 from src.repositories.organization_member_repository import OrganizationMemberRepository
 from src.models.contact import Contact
+from src.services.request_context import RequestContext, resolve_member
+from src.search import contact_search_index
+from src.cache import analytics_cache
 
 
 class ContactService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, context: Optional[RequestContext] = None):
+        self.session = session
+        self.context = context
         self.contact_repo = ContactRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
 
     async def create_contact(self, organization_id: UUID, user_id: UUID, name: str, email: Optional[str] = None,
                              phone: Optional[str] = None, company: Optional[str] = None,
                              notes: Optional[str] = None) -> Contact:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         contact = Contact(
@@ -26,10 +33,14 @@ class ContactService:
             company=company,
             notes=notes
         )
-        return await self.contact_repo.create(contact)
+        contact = await self.contact_repo.create(contact)
+        await self.session.commit()
+        await analytics_cache.touch(organization_id)
+        contact_search_index.upsert(contact)
+        return contact
 
     async def get_contact(self, organization_id: UUID, contact_id: UUID, user_id: UUID) -> Optional[Contact]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         contact = await self.contact_repo.get_by_id(contact_id)
@@ -37,14 +48,23 @@ class ContactService:
             return None
         return contact
 
-    async def list_contacts(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Contact]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+    async def list_contacts(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+                            cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                            sort: Optional[str] = None) -> List[Row]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
-        return await self.contact_repo.get_by_organization(organization_id, skip, limit)
+        return await self.contact_repo.get_by_organization(organization_id, skip, limit, cursor, filters, sort)
+
+    async def search_contacts(self, organization_id: UUID, user_id: UUID, query: str,
+                              limit: int = 20) -> List[Contact]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        return await self.contact_repo.search(organization_id, query, limit)
 
     async def update_contact(self, organization_id: UUID, contact_id: UUID, user_id: UUID, **kwargs) -> Optional[Contact]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role == "member":
@@ -52,10 +72,15 @@ class ContactService:
         contact = await self.contact_repo.get_by_id(contact_id)
         if not contact or contact.organization_id != organization_id:
             return None
-        return await self.contact_repo.update(contact_id, **kwargs)
+        contact = await self.contact_repo.update(contact_id, **kwargs)
+        await self.session.commit()
+        await analytics_cache.touch(organization_id)
+        if contact:
+            contact_search_index.upsert(contact)
+        return contact
 
     async def delete_contact(self, organization_id: UUID, contact_id: UUID, user_id: UUID) -> bool:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role not in ["owner", "admin"]:
@@ -63,5 +88,9 @@ class ContactService:
         contact = await self.contact_repo.get_by_id(contact_id)
         if not contact or contact.organization_id != organization_id:
             return False
-        return await self.contact_repo.delete(contact_id)
+        result = await self.contact_repo.delete(contact_id)
+        await self.session.commit()
+        await analytics_cache.touch(organization_id)
+        contact_search_index.remove(organization_id, contact_id)
+        return result
 
@@ -0,0 +1,62 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.config import app_settings
+from src.repositories.task_repository import TaskRepository
+from src.repositories.deal_repository import DealRepository
+from src.repositories.activity_repository import ActivityRepository
+from src.services.analytics_service import AnalyticsService
+from src.services.request_context import RequestContext
+
+
+class DashboardService:
+    def __init__(self, session_maker: async_sessionmaker, context: RequestContext,
+                 timeout_ms: Optional[int] = None):
+        self.session_maker = session_maker
+        self.context = context
+        self.timeout = (timeout_ms or app_settings.dashboard_timeout_ms) / 1000
+
+    async def get_dashboard(self, limit: int = 20) -> dict:
+        sections: Dict[str, Callable[[AsyncSession, int], Awaitable]] = {
+            "tasks": self._load_tasks,
+            "deals": self._load_deals,
+            "activities": self._load_activities,
+            "summary": self._load_summary,
+        }
+        running = {name: asyncio.create_task(self._run(load, limit)) for name, load in sections.items()}
+        done, pending = await asyncio.wait(running.values(), timeout=self.timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        dashboard = {"timed_out": []}
+        for name, task in running.items():
+            if task in done:
+                dashboard[name] = task.result()
+            else:
+                dashboard[name] = None
+                dashboard["timed_out"].append(name)
+        return dashboard
+
+    async def _run(self, load: Callable[[AsyncSession, int], Awaitable], limit: int):
+        async with self.session_maker() as session:
+            return await load(session, limit)
+
+    async def _load_tasks(self, session: AsyncSession, limit: int):
+        return await TaskRepository(session).get_by_user(self.context.organization_id, self.context.user_id, limit)
+
+    async def _load_deals(self, session: AsyncSession, limit: int):
+        return await DealRepository(session).get_by_organization(
+            self.context.organization_id,
+            limit=limit,
+            filters={"status": "open"}
+        )
+
+    async def _load_activities(self, session: AsyncSession, limit: int):
+        return await ActivityRepository(session).get_by_organization(self.context.organization_id, limit=limit)
+
+    async def _load_summary(self, session: AsyncSession, limit: int):
+        return await AnalyticsService(session, self.context).get_deals_summary(
+            self.context.organization_id,
+            self.context.user_id
+        )
@@ -1,26 +1,33 @@
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.deal_repository import DealRepository
+from src.repositories.base_repository import Cursor
 from src.repositories.contact_repository import ContactRepository
 from src.repositories.organization_member_repository import OrganizationMemberRepository
-from src.repositories.activity_repository import ActivityRepository
+from src.repositories.deal_stat_repository import DealStatRepository
 from src.models.deal import Deal
-from src.models.activity import Activity
+from src.services.request_context import RequestContext, resolve_member
+from src.services.activity_writer import ActivityRecorder
+from src.cache import analytics_cache
 
 
 class DealService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, context: Optional[RequestContext] = None):
+        self.session = session
+        self.context = context
         self.deal_repo = DealRepository(session)
         self.contact_repo = ContactRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
-        self.activity_repo = ActivityRepository(session)
+        self.deal_stat_repo = DealStatRepository(session)
+        self.activities = ActivityRecorder(session)
 
     async def create_deal(self, organization_id: UUID, user_id: UUID, contact_id: UUID, title: str,
                           value: Optional[float] = None, stage: str = "new", notes: Optional[str] = None) -> Deal:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         contact = await self.contact_repo.get_by_id(contact_id)
@@ -35,18 +42,22 @@ class DealService:
             notes=notes
         )
         deal = await self.deal_repo.create(deal)
-        activity = Activity(
+        await self.deal_stat_repo.apply_deltas(organization_id, [((deal.stage, deal.status), 1, deal.value)])
+        await self.activities.add(
             organization_id=organization_id,
             user_id=user_id,
             deal_id=deal.id,
             type="deal_created",
-            description=f"deal '{title}' created"
+            description=f"deal '{title}' created",
+            to_stage=deal.stage
         )
-        await self.activity_repo.create(activity)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.invalidate(organization_id)
         return deal
 
     async def get_deal(self, organization_id: UUID, deal_id: UUID, user_id: UUID) -> Optional[Deal]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         deal = await self.deal_repo.get_by_id(deal_id)
@@ -54,64 +65,128 @@ class DealService:
             return None
         return deal
 
-    async def list_deals(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Deal]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+    async def list_deals(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+                         cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                         sort: Optional[str] = None) -> List[Row]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
-        return await self.deal_repo.get_by_organization(organization_id, skip, limit)
+        return await self.deal_repo.get_by_organization(organization_id, skip, limit, cursor, filters, sort)
 
     async def update_deal(self, organization_id: UUID, deal_id: UUID, user_id: UUID, **kwargs) -> Optional[Deal]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role == "member":
             raise ValueError("insufficient permissions")
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not deal or deal.organization_id != organization_id:
             return None
         old_stage = deal.stage
+        old_key, old_value = (deal.stage, deal.status), deal.value
         deal = await self.deal_repo.update(deal_id, **kwargs)
+        if deal and ((deal.stage, deal.status), deal.value) != (old_key, old_value):
+            await self.deal_stat_repo.apply_deltas(
+                organization_id,
+                [(old_key, -1, old_value), ((deal.stage, deal.status), 1, deal.value)]
+            )
         if deal and "stage" in kwargs and kwargs["stage"] != old_stage:
-            activity = Activity(
+            await self.activities.add(
                 organization_id=organization_id,
                 user_id=user_id,
                 deal_id=deal.id,
                 type="deal_stage_changed",
-                description=f"deal stage changed from {old_stage} to {kwargs['stage']}"
+                description=f"deal stage changed from {old_stage} to {kwargs['stage']}",
+                from_stage=old_stage,
+                to_stage=kwargs["stage"]
             )
-            await self.activity_repo.create(activity)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.invalidate(
+            organization_id,
+            history=deal is not None and deal.status == "closed" and deal.value != old_value
+        )
         return deal
 
+    async def update_deals(self, organization_id: UUID, deal_ids: List[UUID], user_id: UUID,
+                           **kwargs) -> List[Deal]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        if member.role == "member":
+            raise ValueError("insufficient permissions")
+        deals = await self.deal_repo.get_by_ids(organization_id, deal_ids, for_update=True)
+        if not deals or not kwargs:
+            return deals
+        old_deals = {deal.id: ((deal.stage, deal.status), deal.value) for deal in deals}
+        deals = await self.deal_repo.update_many(organization_id, list(old_deals), **kwargs)
+        deltas = []
+        stage_changes = []
+        history = False
+        for deal in deals:
+            old_key, old_value = old_deals[deal.id]
+            if ((deal.stage, deal.status), deal.value) != (old_key, old_value):
+                deltas += [(old_key, -1, old_value), ((deal.stage, deal.status), 1, deal.value)]
+            history = history or (deal.status == "closed" and deal.value != old_value)
+            if "stage" in kwargs and kwargs["stage"] != old_key[0]:
+                stage_changes.append({
+                    "organization_id": organization_id,
+                    "user_id": user_id,
+                    "deal_id": deal.id,
+                    "type": "deal_stage_changed",
+                    "description": f"deal stage changed from {old_key[0]} to {kwargs['stage']}",
+                    "from_stage": old_key[0],
+                    "to_stage": kwargs["stage"]
+                })
+        await self.deal_stat_repo.apply_deltas(organization_id, deltas)
+        await self.activities.add_many(stage_changes)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.invalidate(organization_id, history=history)
+        return deals
+
     async def close_deal(self, organization_id: UUID, deal_id: UUID, user_id: UUID) -> Optional[Deal]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role == "member":
             raise ValueError("insufficient permissions")
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not deal or deal.organization_id != organization_id:
             return None
         if deal.status == "closed":
             raise ValueError("deal already closed")
+        old_key = (deal.stage, deal.status)
         deal = await self.deal_repo.update(deal_id, status="closed", closed_at=datetime.utcnow())
-        activity = Activity(
+        await self.deal_stat_repo.apply_deltas(
+            organization_id,
+            [(old_key, -1, deal.value), ((deal.stage, deal.status), 1, deal.value)]
+        )
+        await self.activities.add(
             organization_id=organization_id,
             user_id=user_id,
             deal_id=deal.id,
             type="deal_closed",
             description=f"deal '{deal.title}' closed"
         )
-        await self.activity_repo.create(activity)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.invalidate(organization_id)
         return deal
 
     async def delete_deal(self, organization_id: UUID, deal_id: UUID, user_id: UUID) -> bool:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role not in ["owner", "admin"]:
             raise ValueError("insufficient permissions")
-        deal = await self.deal_repo.get_by_id(deal_id)
+        deal = await self.deal_repo.get_by_id(deal_id, for_update=True)
         if not deal or deal.organization_id != organization_id:
             return False
-        return await self.deal_repo.delete(deal_id)
+        result = await self.deal_repo.delete(deal_id)
+        if result:
+            await self.deal_stat_repo.apply_deltas(organization_id, [((deal.stage, deal.status), -1, deal.value)])
+        await self.session.commit()
+        await analytics_cache.invalidate(organization_id, history=True)
+        return result
 
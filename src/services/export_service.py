@@ -0,0 +1,87 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Optional, Sequence
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import app_settings
+from src.models.organization_member import OrganizationMember
+from src.models.contact import Contact
+from src.models.deal import Deal
+from src.models.task import Task
+from src.models.activity import Activity
+
+EXPORT_MODELS = {
+    "contacts": Contact,
+    "deals": Deal,
+    "tasks": Task,
+    "activities": Activity,
+}
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "columnar": "application/x-ndjson",
+}
+
+
+def to_json_value(value: Any) -> Any:
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+class ExportService:
+    def __init__(self, session_maker: async_sessionmaker, batch_size: Optional[int] = None):
+        self.session_maker = session_maker
+        self.batch_size = batch_size or app_settings.export_batch_size
+
+    @staticmethod
+    def check_access(member: OrganizationMember, entity: str) -> None:
+        if member.role not in ["owner", "admin"]:
+            raise ValueError("insufficient permissions")
+        if entity not in EXPORT_MODELS:
+            raise LookupError("unknown export entity")
+
+    async def stream(self, organization_id: UUID, entity: str, format: str) -> AsyncIterator[bytes]:
+        model = EXPORT_MODELS[entity]
+        columns = list(model.__table__.columns)
+        names = [column.name for column in columns]
+        stmt = (
+            select(*columns)
+            .where(model.organization_id == organization_id)
+            .order_by(model.created_at, model.id)
+            .execution_options(yield_per=self.batch_size)
+        )
+        if format == "csv":
+            yield self._csv([names])
+        async with self.session_maker() as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                if format == "csv":
+                    yield self._csv(rows)
+                elif format == "ndjson":
+                    yield "".join(
+                        json.dumps({name: to_json_value(value) for name, value in zip(names, row)}) + "\n"
+                        for row in rows
+                    ).encode()
+                else:
+                    batch = {name: [to_json_value(row[i]) for row in rows] for i, name in enumerate(names)}
+                    yield (json.dumps({"rows": len(rows), "columns": batch}) + "\n").encode()
+
+    @staticmethod
+    def _csv(rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(
+            ["" if value is None else to_json_value(value) for value in row]
+            for row in rows
+        )
+        return buffer.getvalue().encode()
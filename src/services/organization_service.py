@@ -10,6 +10,7 @@ from src.models.organization_member import OrganizationMember
 
 class OrganizationService:
     def __init__(self, session: AsyncSession):
+        self.session = session
         self.org_repo = OrganizationRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
 
@@ -22,6 +23,7 @@ class OrganizationService:
             role="owner"
         )
         await self.member_repo.create(member)
+        await self.session.commit()
         return org
 
     async def add_member(self, organization_id: UUID, user_id: UUID, role: str, current_user_id: UUID) -> OrganizationMember:
@@ -40,7 +42,9 @@ class OrganizationService:
             user_id=user_id,
             role=role
         )
-        return await self.member_repo.create(member)
+        member = await self.member_repo.create(member)
+        await self.session.commit()
+        return member
 
     async def get_organization(self, organization_id: UUID) -> Optional[Organization]:
         return await self.org_repo.get_by_id(organization_id)
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+
+from src.models.user import User
+from src.models.organization_member import OrganizationMember
+from src.repositories.organization_member_repository import OrganizationMemberRepository
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    id: UUID
+    email: str
+    full_name: str
+
+    @classmethod
+    def from_model(cls, user: User) -> "CurrentUser":
+        return cls(id=user.id, email=user.email, full_name=user.full_name)
+
+
+@dataclass
+class RequestContext:
+    user: CurrentUser
+    member: OrganizationMember
+
+    @property
+    def user_id(self) -> UUID:
+        return self.user.id
+
+    @property
+    def organization_id(self) -> UUID:
+        return self.member.organization_id
+
+
+async def resolve_member(context: Optional[RequestContext], member_repo: OrganizationMemberRepository,
+                         organization_id: UUID, user_id: UUID) -> Optional[OrganizationMember]:
+    if context is not None and context.organization_id == organization_id and context.user_id == user_id:
+        return context.member
+    return await member_repo.get_by_org_and_user(organization_id, user_id)
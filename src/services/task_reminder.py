@@ -0,0 +1,83 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+from uuid import uuid4
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.config import app_settings
+from src.cache import analytics_cache
+from src.models.activity import Activity
+from src.repositories.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+class OverdueTaskScanner:
+    def __init__(self, interval_seconds: float = 60, batch_size: int = 500):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.session_maker: Optional[async_sessionmaker] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self, session_maker: async_sessionmaker) -> None:
+        if self.running or not self.interval_seconds:
+            return
+        self.session_maker = session_maker
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.scan()
+            except Exception:
+                logger.exception("overdue task scan failed")
+
+    async def scan(self, now: Optional[datetime] = None) -> int:
+        now = now or datetime.now(timezone.utc)
+        total = 0
+        while True:
+            async with self.session_maker() as session:
+                tasks = await TaskRepository(session).claim_overdue(now, self.batch_size)
+                notified = [task for task in tasks if task.assigned_to_id is not None]
+                if notified:
+                    await session.execute(insert(Activity), [
+                        {
+                            "id": uuid4(),
+                            "organization_id": task.organization_id,
+                            "user_id": task.assigned_to_id,
+                            "task_id": task.id,
+                            "type": "task_overdue",
+                            "description": f"task '{task.title}' is overdue",
+                            "created_at": now
+                        }
+                        for task in notified
+                    ])
+                await session.commit()
+            for organization_id in {task.organization_id for task in notified}:
+                await analytics_cache.touch(organization_id)
+            total += len(tasks)
+            if len(tasks) < self.batch_size:
+                return total
+
+
+overdue_task_scanner = OverdueTaskScanner(
+    app_settings.task_overdue_scan_interval_seconds,
+    app_settings.task_overdue_scan_batch_size
+)
@@ -1,30 +1,35 @@
 from typing import List, Optional
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.repositories.task_repository import TaskRepository
+from src.repositories.base_repository import Cursor
 from src.repositories.deal_repository import DealRepository
 from src.repositories.contact_repository import ContactRepository
 from src.repositories.organization_member_repository import OrganizationMemberRepository
-from src.repositories.activity_repository import ActivityRepository
 from src.models.task import Task
-from src.models.activity import Activity
+from src.services.request_context import RequestContext, resolve_member
+from src.services.activity_writer import ActivityRecorder
+from src.cache import analytics_cache
 
 
 class TaskService:
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, context: Optional[RequestContext] = None):
+        self.session = session
+        self.context = context
         self.task_repo = TaskRepository(session)
         self.deal_repo = DealRepository(session)
         self.contact_repo = ContactRepository(session)
         self.member_repo = OrganizationMemberRepository(session)
-        self.activity_repo = ActivityRepository(session)
+        self.activities = ActivityRecorder(session)
 
     async def create_task(self, organization_id: UUID, user_id: UUID, title: str,
                          description: Optional[str] = None, deal_id: Optional[UUID] = None,
                          contact_id: Optional[UUID] = None, assigned_to_id: Optional[UUID] = None,
                          due_date: Optional[datetime] = None) -> Task:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if deal_id:
@@ -45,18 +50,20 @@ class TaskService:
             due_date=due_date
         )
         task = await self.task_repo.create(task)
-        activity = Activity(
+        await self.activities.add(
             organization_id=organization_id,
             user_id=user_id,
             task_id=task.id,
             type="task_created",
             description=f"task '{title}' created"
         )
-        await self.activity_repo.create(activity)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.touch(organization_id)
         return task
 
     async def get_task(self, organization_id: UUID, task_id: UUID, user_id: UUID) -> Optional[Task]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         task = await self.task_repo.get_by_id(task_id)
@@ -64,14 +71,48 @@ class TaskService:
             return None
         return task
 
-    async def list_tasks(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100) -> List[Task]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+    async def list_tasks(self, organization_id: UUID, user_id: UUID, skip: int = 0, limit: int = 100,
+                         cursor: Optional[Cursor] = None, filters: Optional[dict] = None,
+                         sort: Optional[str] = None) -> List[Row]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
-        return await self.task_repo.get_by_organization(organization_id, skip, limit)
+        return await self.task_repo.get_by_organization(organization_id, skip, limit, cursor, filters, sort)
+
+    async def list_overdue_tasks(self, organization_id: UUID, user_id: UUID, mine: bool = False,
+                                 limit: int = 100) -> List[Row]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        return await self.task_repo.get_open_by_due_date(
+            organization_id,
+            due_before=datetime.now(timezone.utc),
+            assigned_to_id=user_id if mine else None,
+            limit=limit
+        )
+
+    async def list_due_soon_tasks(self, organization_id: UUID, user_id: UUID, days: int = 7, mine: bool = False,
+                                  limit: int = 100) -> List[Row]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        now = datetime.now(timezone.utc)
+        return await self.task_repo.get_open_by_due_date(
+            organization_id,
+            due_after=now,
+            due_before=now + timedelta(days=days),
+            assigned_to_id=user_id if mine else None,
+            limit=limit
+        )
+
+    async def count_overdue_tasks(self, organization_id: UUID, user_id: UUID) -> int:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        return await self.task_repo.count_overdue(organization_id, datetime.now(timezone.utc))
 
     async def update_task(self, organization_id: UUID, task_id: UUID, user_id: UUID, **kwargs) -> Optional[Task]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         task = await self.task_repo.get_by_id(task_id)
@@ -79,10 +120,19 @@ class TaskService:
             return None
         if member.role == "member" and task.assigned_to_id != user_id:
             raise ValueError("insufficient permissions")
-        return await self.task_repo.update(task_id, **kwargs)
+        was_completed = task.status == "completed"
+        if "due_date" in kwargs:
+            kwargs["overdue_notified_at"] = None
+        task = await self.task_repo.update(task_id, **kwargs)
+        await self.session.commit()
+        if was_completed and task.status != "completed":
+            await analytics_cache.invalidate(organization_id, history=True)
+        else:
+            await analytics_cache.touch(organization_id)
+        return task
 
     async def complete_task(self, organization_id: UUID, task_id: UUID, user_id: UUID) -> Optional[Task]:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         task = await self.task_repo.get_by_id(task_id)
@@ -91,18 +141,46 @@ class TaskService:
         if task.status == "completed":
             raise ValueError("task already completed")
         task = await self.task_repo.update(task_id, status="completed", completed_at=datetime.utcnow())
-        activity = Activity(
+        await self.activities.add(
             organization_id=organization_id,
             user_id=user_id,
             task_id=task.id,
             type="task_completed",
             description=f"task '{task.title}' completed"
         )
-        await self.activity_repo.create(activity)
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.touch(organization_id)
         return task
 
+    async def complete_tasks(self, organization_id: UUID, task_ids: List[UUID], user_id: UUID) -> List[Task]:
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
+        if not member:
+            raise ValueError("access denied")
+        tasks = await self.task_repo.update_many(
+            organization_id,
+            task_ids,
+            Task.status != "completed",
+            status="completed",
+            completed_at=datetime.utcnow()
+        )
+        await self.activities.add_many([
+            {
+                "organization_id": organization_id,
+                "user_id": user_id,
+                "task_id": task.id,
+                "type": "task_completed",
+                "description": f"task '{task.title}' completed"
+            }
+            for task in tasks
+        ])
+        await self.session.commit()
+        await self.activities.publish()
+        await analytics_cache.touch(organization_id)
+        return tasks
+
     async def delete_task(self, organization_id: UUID, task_id: UUID, user_id: UUID) -> bool:
-        member = await self.member_repo.get_by_org_and_user(organization_id, user_id)
+        member = await resolve_member(self.context, self.member_repo, organization_id, user_id)
         if not member:
             raise ValueError("access denied")
         if member.role == "member":
@@ -110,5 +188,12 @@ class TaskService:
         task = await self.task_repo.get_by_id(task_id)
         if not task or task.organization_id != organization_id:
             return False
-        return await self.task_repo.delete(task_id)
+        was_completed = task.status == "completed"
+        result = await self.task_repo.delete(task_id)
+        await self.session.commit()
+        if was_completed:
+            await analytics_cache.invalidate(organization_id, history=True)
+        else:
+            await analytics_cache.touch(organization_id)
+        return result
 
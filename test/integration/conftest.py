@@ -0,0 +1,42 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.database import get_db, get_session_maker
+from test.conftest import test_session_maker
+
+
+@pytest.fixture
+def client(db_session, override_get_db, monkeypatch):
+    monkeypatch.setattr("src.main.async_session_maker", test_session_maker)
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_maker] = lambda: test_session_maker
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/register",
+        json={
+            "email": "test@example.com",
+            "password": "password123",
+            "full_name": "test user"
+        }
+    )
+    login_response = client.post(
+        "/api/v1/login",
+        params={"email": "test@example.com", "password": "password123"}
+    )
+    token = login_response.json()["access_token"]
+    org_response = client.post(
+        "/api/v1/organizations",
+        json={"name": "test org"},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    return {
+        "Authorization": f"Bearer {token}",
+        "X-Organization-Id": org_response.json()["id"]
+    }
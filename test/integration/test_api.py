@@ -1,18 +1,4 @@
 import pytest
-from httpx import AsyncClient
-from fastapi.testclient import TestClient
-
-from src.main import app
-from src.database import get_db
-from test.conftest import override_get_db
-
-
-@pytest.fixture
-def client(db_session, override_get_db):
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
 
 
 def test_register_user(client):
@@ -218,3 +204,128 @@ def test_get_analytics_summary(client):
     assert "total_value" in data
     assert "avg_value" in data
 
+
+
+def test_get_analytics_overview(client, auth_headers):
+    contact_response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe"},
+        headers=auth_headers
+    )
+    contact_id = contact_response.json()["id"]
+    for stage, value in [("new", 100.0), ("new", 200.0), ("won_back", 50.0)]:
+        client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_id, "title": "deal", "value": value, "stage": stage},
+            headers=auth_headers
+        )
+    response = client.get("/api/v1/analytics/deals/overview", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "3"
+    data = response.json()
+    stages = {stage["stage"]: stage for stage in data["stages"]}
+    assert stages["new"]["count"] == 2
+    assert stages["new"]["total_value"] == 300.0
+    assert stages["won_back"]["count"] == 1
+    assert stages["proposal"]["count"] == 0
+    assert data["summary"]["total"] == 0
+    funnel = client.get("/api/v1/analytics/deals/funnel", headers=auth_headers).json()
+    assert funnel["won_back"] == 1
+
+
+def test_get_analytics_time_series(client, auth_headers):
+    contact_response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe"},
+        headers=auth_headers
+    )
+    client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "deal", "value": 100.0},
+        headers=auth_headers
+    )
+    response = client.get("/api/v1/analytics/deals/created", params={"granularity": "day"}, headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["granularity"] == "day"
+    assert len(data["points"]) == 31
+    assert data["points"][-1]["count"] == 1
+    response = client.get(
+        "/api/v1/analytics/deals/revenue",
+        params={"start": "2024-03-01", "end": "2024-01-01"},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+    response = client.get("/api/v1/analytics/tasks/completed", params={"granularity": "hour"}, headers=auth_headers)
+    assert response.status_code == 422
+
+
+def test_get_my_dashboard(client, auth_headers):
+    contact_response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe"},
+        headers=auth_headers
+    )
+    for title in ["open deal", "closed deal"]:
+        deal_response = client.post(
+            "/api/v1/deals",
+            json={"contact_id": contact_response.json()["id"], "title": title, "value": 100.0},
+            headers=auth_headers
+        )
+    client.post(f"/api/v1/deals/{deal_response.json()['id']}/close", headers=auth_headers)
+    response = client.get("/api/v1/me/dashboard", headers=auth_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["timed_out"] == []
+    assert data["tasks"] == []
+    assert [deal["title"] for deal in data["deals"]] == ["open deal"]
+    assert sorted(activity["type"] for activity in data["activities"]) == ["deal_closed", "deal_created", "deal_created"]
+    assert data["summary"]["total"] == 1
+
+
+def test_entity_etag(client, auth_headers):
+    response = client.post("/api/v1/contacts", json={"name": "john doe"}, headers=auth_headers)
+    contact_id = response.json()["id"]
+    response = client.get(f"/api/v1/contacts/{contact_id}", headers=auth_headers)
+    etag = response.headers["ETag"]
+    response = client.get(f"/api/v1/contacts/{contact_id}", headers={**auth_headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    response = client.get(f"/api/v1/contacts/{contact_id}", headers={**auth_headers, "If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["name"] == "john doe"
+
+
+def test_list_etag_changes_on_write(client, auth_headers, monkeypatch):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "local_version_etags", True)
+    response = client.get("/api/v1/contacts", headers=auth_headers)
+    etag = response.headers["ETag"]
+    conditional_headers = {**auth_headers, "If-None-Match": etag}
+    assert client.get("/api/v1/contacts", headers=conditional_headers).status_code == 304
+    assert client.get("/api/v1/contacts", params={"limit": 10}, headers=conditional_headers).status_code == 200
+    client.post("/api/v1/contacts", json={"name": "john doe"}, headers=auth_headers)
+    response = client.get("/api/v1/contacts", headers=conditional_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    summary = client.get("/api/v1/analytics/deals/summary", headers=auth_headers)
+    response = client.get(
+        "/api/v1/analytics/deals/summary",
+        headers={**auth_headers, "If-None-Match": summary.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+
+def test_list_defers_notes(client, auth_headers):
+    response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe", "notes": "long notes"},
+        headers=auth_headers
+    )
+    contact_id = response.json()["id"]
+    contacts = client.get("/api/v1/contacts", headers=auth_headers).json()
+    assert contacts[0]["id"] == contact_id
+    assert "notes" not in contacts[0]
+    contact = client.get(f"/api/v1/contacts/{contact_id}", headers=auth_headers).json()
+    assert contact["notes"] == "long notes"
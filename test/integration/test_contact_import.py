@@ -0,0 +1,68 @@
+import json
+
+
+def test_import_contacts_csv(client, auth_headers):
+    content = "name,email,company\njohn doe,john@example.com,acme\n,missing@example.com,\njane doe,,\n"
+    response = client.post(
+        "/api/v1/contacts/import",
+        files={"file": ("contacts.csv", content, "text/csv")},
+        headers=auth_headers
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+    job = client.get(f"/api/v1/contacts/import/{job_id}", headers=auth_headers).json()
+    assert job["status"] == "completed"
+    assert job["processed"] == 3
+    assert job["imported"] == 2
+    assert job["failed"] == 1
+    assert job["errors"][0]["row"] == 2
+    assert job["bytes_processed"] == job["bytes_total"]
+    contacts = client.get("/api/v1/contacts", headers=auth_headers).json()
+    assert sorted(contact["name"] for contact in contacts) == ["jane doe", "john doe"]
+
+
+def test_import_contacts_ndjson_batches(client, auth_headers, monkeypatch):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "contact_import_batch_size", 2)
+    lines = [json.dumps({"name": f"contact {i}"}) for i in range(5)] + ["not json"]
+    response = client.post(
+        "/api/v1/contacts/import",
+        files={"file": ("contacts.ndjson", "\n".join(lines), "application/x-ndjson")},
+        headers=auth_headers
+    )
+    job_id = response.json()["id"]
+    job = client.get(f"/api/v1/contacts/import/{job_id}", headers=auth_headers).json()
+    assert job["status"] == "completed"
+    assert job["imported"] == 5
+    assert job["failed"] == 1
+    assert "invalid json" in job["errors"][0]["error"]
+
+
+def test_import_contacts_unsupported_format(client, auth_headers):
+    response = client.post(
+        "/api/v1/contacts/import",
+        files={"file": ("contacts.xlsx", "data", "application/octet-stream")},
+        headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_import_contacts_removes_spool_when_registration_fails(client, auth_headers, monkeypatch, tmp_path):
+    import os
+    import tempfile
+    from src.api.v1 import contacts
+
+    async def broken_register_job(session, job):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr(contacts, "register_job", broken_register_job)
+    try:
+        client.post(
+            "/api/v1/contacts/import",
+            files={"file": ("contacts.csv", "name\njohn doe\n", "text/csv")},
+            headers=auth_headers
+        )
+    except RuntimeError:
+        pass
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,37 @@
+def create_contact(client, auth_headers, **data):
+    return client.post("/api/v1/contacts", json=data, headers=auth_headers).json()
+
+
+def search(client, auth_headers, q, **params):
+    response = client.get("/api/v1/contacts/search", params={"q": q, **params}, headers=auth_headers)
+    assert response.status_code == 200
+    return [contact["name"] for contact in response.json()]
+
+
+def test_search_contacts_by_prefix_and_fields(client, auth_headers):
+    create_contact(client, auth_headers, name="John Smith", email="john@acme.io", company="Acme")
+    create_contact(client, auth_headers, name="Johanna Berg", company="Globex")
+    create_contact(client, auth_headers, name="Peter Parker", email="peter@dailybugle.com", phone="555-0100")
+    assert search(client, auth_headers, "jo") == ["Johanna Berg", "John Smith"]
+    assert search(client, auth_headers, "john sm") == ["John Smith"]
+    assert search(client, auth_headers, "dailybugle") == ["Peter Parker"]
+    assert search(client, auth_headers, "glob") == ["Johanna Berg"]
+    assert search(client, auth_headers, "jo", limit=1) == ["Johanna Berg"]
+    assert search(client, auth_headers, "nobody") == []
+
+
+def test_search_reflects_contact_writes(client, auth_headers):
+    contact = create_contact(client, auth_headers, name="Alice Cooper")
+    assert search(client, auth_headers, "ali") == ["Alice Cooper"]
+    client.patch(f"/api/v1/contacts/{contact['id']}", json={"name": "Bob Cooper"}, headers=auth_headers)
+    assert search(client, auth_headers, "ali") == []
+    assert search(client, auth_headers, "bob") == ["Bob Cooper"]
+    create_contact(client, auth_headers, name="Carol Cooper")
+    assert search(client, auth_headers, "cooper") == ["Bob Cooper", "Carol Cooper"]
+    client.delete(f"/api/v1/contacts/{contact['id']}", headers=auth_headers)
+    assert search(client, auth_headers, "cooper") == ["Carol Cooper"]
+
+
+def test_search_requires_query(client, auth_headers):
+    response = client.get("/api/v1/contacts/search", headers=auth_headers)
+    assert response.status_code == 422
@@ -0,0 +1,40 @@
+import csv
+import io
+import json
+
+
+def create_contacts(client, auth_headers, count):
+    for i in range(count):
+        client.post("/api/v1/contacts", json={"name": f"contact {i}", "email": f"c{i}@example.com"}, headers=auth_headers)
+
+
+def test_export_contacts_csv(client, auth_headers):
+    create_contacts(client, auth_headers, 3)
+    response = client.get("/api/v1/export/contacts", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "contacts.csv" in response.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert sorted(row["name"] for row in rows) == ["contact 0", "contact 1", "contact 2"]
+    assert {row["email"] for row in rows} == {"c0@example.com", "c1@example.com", "c2@example.com"}
+    assert rows[0]["phone"] == ""
+
+
+def test_export_contacts_ndjson_and_columnar(client, auth_headers, monkeypatch):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "export_batch_size", 2)
+    create_contacts(client, auth_headers, 3)
+    response = client.get("/api/v1/export/contacts?format=ndjson", headers=auth_headers)
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(record["name"] for record in records) == ["contact 0", "contact 1", "contact 2"]
+    response = client.get("/api/v1/export/contacts?format=columnar", headers=auth_headers)
+    batches = [json.loads(line) for line in response.text.splitlines()]
+    assert [batch["rows"] for batch in batches] == [2, 1]
+    assert sorted(batches[0]["columns"]["name"] + batches[1]["columns"]["name"]) == [
+        "contact 0", "contact 1", "contact 2"
+    ]
+
+
+def test_export_rejects_unknown_entity_and_format(client, auth_headers):
+    assert client.get("/api/v1/export/users", headers=auth_headers).status_code == 404
+    assert client.get("/api/v1/export/deals?format=parquet", headers=auth_headers).status_code == 422
@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.fixture
+def internal_headers(monkeypatch):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "internal_token", "internal-secret")
+    return {"Authorization": "Bearer internal-secret"}
+
+
+def test_internal_endpoints_require_token(client, monkeypatch):
+    from src.config import app_settings
+    assert client.get("/internal/pool").status_code == 404
+    assert client.get("/metrics").status_code == 404
+    monkeypatch.setattr(app_settings, "internal_token", "internal-secret")
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+
+
+def test_internal_pool_endpoint(client, internal_headers):
+    response = client.get("/internal/pool", headers=internal_headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert "pool_class" in data["database"]
+    assert "queued" in data["password_hasher"]
+
+
+def test_metrics_endpoint(client, auth_headers, internal_headers):
+    client.get("/api/v1/contacts", headers=auth_headers)
+    response = client.get("/metrics", headers=internal_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/v1/contacts",status="200"}' in response.text
+    assert 'db_queries_total{method="GET",route="/api/v1/contacts"}' in response.text
+
+
+def test_server_timing_and_slow_query_log(client, auth_headers, monkeypatch, caplog):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "server_timing_enabled", True)
+    monkeypatch.setattr(app_settings, "slow_query_threshold_ms", 0)
+    response = client.get("/api/v1/contacts", headers=auth_headers)
+    assert response.headers["Server-Timing"].startswith('db;dur=')
+    assert '"3 queries"' in response.headers["Server-Timing"]
+    assert any(record.getMessage().startswith("slow query") for record in caplog.records)
+
+
+def test_n_plus_one_is_flagged(client, auth_headers, monkeypatch, caplog):
+    from src import metrics
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "n_plus_one_threshold", 2)
+    labels = ("GET", "/api/v1/contacts")
+    before = metrics.n_plus_one.get(labels)
+    client.get("/api/v1/contacts", headers=auth_headers)
+    assert metrics.n_plus_one.get(labels) == before
+    monkeypatch.setattr(app_settings, "n_plus_one_threshold", 1)
+    client.get("/api/v1/contacts", headers=auth_headers)
+    assert metrics.n_plus_one.get(labels) == before + 1
+    assert any("possible n+1" in record.getMessage() for record in caplog.records)
@@ -0,0 +1,56 @@
+def create_contact(client, auth_headers, name, **data):
+    return client.post("/api/v1/contacts", json={"name": name, **data}, headers=auth_headers).json()
+
+
+def create_deal(client, auth_headers, contact_id, title, value, stage="new"):
+    return client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_id, "title": title, "value": value, "stage": stage},
+        headers=auth_headers
+    ).json()
+
+
+def titles(response):
+    assert response.status_code == 200, response.text
+    return [item["title"] for item in response.json()]
+
+
+def test_filter_and_sort_deals(client, auth_headers):
+    acme = create_contact(client, auth_headers, "acme buyer")
+    globex = create_contact(client, auth_headers, "globex buyer")
+    create_deal(client, auth_headers, acme["id"], "small", 100)
+    create_deal(client, auth_headers, acme["id"], "medium", 5000, stage="proposal")
+    create_deal(client, auth_headers, globex["id"], "large", 90000, stage="negotiation")
+    get = lambda params: client.get("/api/v1/deals", params=params, headers=auth_headers)
+    assert titles(get({"sort": "-value"})) == ["large", "medium", "small"]
+    assert titles(get({"sort": "title"})) == ["large", "medium", "small"]
+    assert titles(get({"contact_id": acme["id"], "sort": "value"})) == ["small", "medium"]
+    assert titles(get([("stage", "proposal"), ("stage", "negotiation"), ("sort", "value")])) == ["medium", "large"]
+    assert titles(get({"min_value": 1000, "max_value": 10000})) == ["medium"]
+    assert titles(get({"status": "won"})) == []
+
+
+def test_filter_tasks_and_contacts(client, auth_headers):
+    create_contact(client, auth_headers, "bob", company="acme")
+    create_contact(client, auth_headers, "alice", company="acme")
+    create_contact(client, auth_headers, "carol", company="globex")
+    response = client.get("/api/v1/contacts", params={"company": "acme", "sort": "name"}, headers=auth_headers)
+    assert [contact["name"] for contact in response.json()] == ["alice", "bob"]
+    client.post("/api/v1/tasks", json={"title": "later", "due_date": "2030-01-01T00:00:00"}, headers=auth_headers)
+    client.post("/api/v1/tasks", json={"title": "sooner", "due_date": "2029-01-01T00:00:00"}, headers=auth_headers)
+    response = client.get("/api/v1/tasks", params={"sort": "due_date"}, headers=auth_headers)
+    assert titles(response) == ["sooner", "later"]
+    response = client.get("/api/v1/tasks", params={"due_before": "2029-06-01T00:00:00"}, headers=auth_headers)
+    assert titles(response) == ["sooner"]
+
+
+def test_sort_validation(client, auth_headers):
+    response = client.get("/api/v1/deals", params={"sort": "notes"}, headers=auth_headers)
+    assert response.status_code == 422
+    create_contact(client, auth_headers, "first")
+    create_contact(client, auth_headers, "second")
+    cursor = client.get("/api/v1/contacts", params={"limit": 1}, headers=auth_headers).headers["X-Next-Cursor"]
+    response = client.get("/api/v1/contacts", params={"cursor": cursor, "sort": "name"}, headers=auth_headers)
+    assert response.status_code == 400
+    response = client.get("/api/v1/contacts", params={"limit": 1, "sort": "name"}, headers=auth_headers)
+    assert "X-Next-Cursor" not in response.headers
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import pytest
+from httpx import AsyncClient
+
+from src.main import app
+from src.database import get_db
+from src.services.auth_service import AuthService, password_hasher
+from test.conftest import test_session_maker
+
+
+class BlockingContext:
+    def __init__(self, parties):
+        self.barrier = threading.Barrier(parties + 1, timeout=5)
+        self.release = threading.Event()
+        self.threads = set()
+
+    def verify(self, password, hashed_password):
+        self.threads.add(threading.current_thread().name)
+        self.barrier.wait()
+        self.release.wait(5)
+        return True
+
+
+@pytest.fixture
+async def async_client(db_session):
+    async def _get_db():
+        async with test_session_maker() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = _get_db
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+async def test_logins_verify_concurrently_off_the_event_loop(db_session, async_client, monkeypatch):
+    await AuthService(db_session).register_user(
+        email="load@example.com",
+        password="password123",
+        full_name="load test"
+    )
+    context = BlockingContext(password_hasher.max_workers)
+    monkeypatch.setattr(password_hasher, "context", context)
+    logins = [
+        asyncio.create_task(
+            async_client.post("/api/v1/login", params={"email": "load@example.com", "password": "password123"})
+        )
+        for _ in range(password_hasher.max_workers)
+    ]
+    try:
+        await asyncio.to_thread(context.barrier.wait)
+        response = await async_client.get("/")
+        assert response.status_code == 200
+    finally:
+        context.release.set()
+    responses = await asyncio.gather(*logins)
+    assert all(response.status_code == 200 for response in responses)
+    assert len(context.threads) == password_hasher.max_workers
+    assert all(name.startswith("password-hasher") for name in context.threads)
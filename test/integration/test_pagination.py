@@ -0,0 +1,54 @@
+def test_contacts_cursor_pagination(client, auth_headers):
+    for i in range(5):
+        client.post("/api/v1/contacts", json={"name": f"contact {i}"}, headers=auth_headers)
+    seen = []
+    response = client.get("/api/v1/contacts", params={"limit": 2}, headers=auth_headers)
+    while True:
+        assert response.status_code == 200
+        seen.extend(contact["id"] for contact in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = client.get(
+            "/api/v1/contacts",
+            params={"limit": 2, "cursor": cursor},
+            headers=auth_headers
+        )
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+    offset_page = client.get("/api/v1/contacts", params={"skip": 2, "limit": 2}, headers=auth_headers)
+    assert [contact["id"] for contact in offset_page.json()] == seen[2:4]
+
+
+def test_invalid_cursor(client, auth_headers):
+    response = client.get("/api/v1/deals", params={"cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_deal_timeline_cursor_pagination(client, auth_headers):
+    contact = client.post("/api/v1/contacts", json={"name": "buyer"}, headers=auth_headers).json()
+    deal = client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact["id"], "title": "deal", "stage": "new"},
+        headers=auth_headers
+    ).json()
+    for stage in ["qualification", "proposal", "negotiation", "closed"]:
+        client.patch(f"/api/v1/deals/{deal['id']}", json={"stage": stage}, headers=auth_headers)
+    seen = []
+    params = {"deal_id": deal["id"], "limit": 2}
+    response = client.get("/api/v1/activities", params=params, headers=auth_headers)
+    while True:
+        assert response.status_code == 200
+        assert len(response.json()) <= 2
+        seen.extend(activity["id"] for activity in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        response = client.get("/api/v1/activities", params={**params, "cursor": cursor}, headers=auth_headers)
+    assert len(set(seen)) == 5
+    response = client.get(
+        "/api/v1/activities",
+        params={"deal_id": deal["id"], "type": "deal_created"},
+        headers=auth_headers
+    )
+    assert [activity["type"] for activity in response.json()] == ["deal_created"]
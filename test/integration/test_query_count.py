@@ -0,0 +1,104 @@
+def _create_deal(client, auth_headers):
+    contact_response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe"},
+        headers=auth_headers
+    )
+    response = client.post(
+        "/api/v1/deals",
+        json={
+            "contact_id": contact_response.json()["id"],
+            "title": "test deal",
+            "value": 1000.0
+        },
+        headers=auth_headers
+    )
+    return response.json()["id"]
+
+
+def test_query_count_header(client, auth_headers):
+    response = client.get("/api/v1/contacts", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "3"
+
+
+def test_update_deal_resolves_membership_once(client, auth_headers):
+    deal_id = _create_deal(client, auth_headers)
+    response = client.patch(
+        f"/api/v1/deals/{deal_id}",
+        json={"title": "renamed"},
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.json()["title"] == "renamed"
+    assert response.headers["X-Query-Count"] == "4"
+
+
+def test_create_deal_round_trips(client, auth_headers):
+    contact_response = client.post(
+        "/api/v1/contacts",
+        json={"name": "john doe"},
+        headers=auth_headers
+    )
+    assert contact_response.headers["X-Query-Count"] == "3"
+    response = client.post(
+        "/api/v1/deals",
+        json={"contact_id": contact_response.json()["id"], "title": "test deal"},
+        headers=auth_headers
+    )
+    assert response.status_code == 201
+    assert response.headers["X-Query-Count"] == "6"
+
+
+def test_analytics_uses_request_membership(client, auth_headers):
+    response = client.get("/api/v1/analytics/deals/funnel", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "3"
+
+
+def test_auth_cache_skips_user_lookup(client, auth_headers, monkeypatch):
+    from src.config import app_settings
+    monkeypatch.setattr(app_settings, "auth_cache_enabled", True)
+    client.get("/api/v1/contacts", headers=auth_headers)
+    response = client.get("/api/v1/contacts", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["X-Query-Count"] == "2"
+
+
+def test_deal_timeline_skips_user_load(client, auth_headers):
+    deal_id = _create_deal(client, auth_headers)
+    response = client.get("/api/v1/activities", params={"deal_id": deal_id}, headers=auth_headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+    assert response.headers["X-Query-Count"] == "3"
+
+
+def test_batch_deal_update_query_count_is_constant(client, auth_headers):
+    deal_ids = [_create_deal(client, auth_headers) for _ in range(3)]
+    single = client.patch(
+        "/api/v1/deals:batch",
+        json={"ids": deal_ids[:1], "stage": "proposal"},
+        headers=auth_headers
+    )
+    batch = client.patch(
+        "/api/v1/deals:batch",
+        json={"ids": deal_ids, "stage": "negotiation"},
+        headers=auth_headers
+    )
+    assert batch.status_code == 200
+    assert len(batch.json()["updated"]) == 3
+    assert batch.headers["X-Query-Count"] == single.headers["X-Query-Count"]
+    empty = client.patch("/api/v1/deals:batch", json={"ids": deal_ids}, headers=auth_headers)
+    assert empty.status_code == 422
+
+
+def test_conditional_get_skips_row_load(client, auth_headers):
+    deal_id = _create_deal(client, auth_headers)
+    response = client.get(f"/api/v1/deals/{deal_id}", headers=auth_headers)
+    assert response.status_code == 200
+    response = client.get(
+        f"/api/v1/deals/{deal_id}",
+        headers={**auth_headers, "If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+    assert response.headers["X-Query-Count"] == "3"
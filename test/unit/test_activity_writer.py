@@ -0,0 +1,63 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy import select
+
+from src.cache import analytics_cache
+from src.config import app_settings
+from src.models.activity import Activity
+from src.services.activity_writer import ActivityWriter, activity_writer
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+from src.services.deal_service import DealService
+from test.conftest import test_session_maker
+
+
+@pytest.mark.asyncio
+async def test_writer_inserts_in_batches_and_flushes_on_stop(db_session):
+    writer = ActivityWriter(batch_size=3, flush_interval_ms=1000, max_queue_size=100)
+    await writer.start(test_session_maker)
+    organization_id, user_id = uuid4(), uuid4()
+    await writer.submit([
+        {"id": uuid4(), "organization_id": organization_id, "user_id": user_id, "type": f"event_{i}"}
+        for i in range(7)
+    ])
+    await writer.stop()
+    assert writer.stats() == {"running": False, "queued": 0, "written": 7, "batches": 3, "failed": 0}
+    result = await db_session.execute(select(Activity.type).where(Activity.organization_id == organization_id))
+    assert sorted(result.scalars()) == [f"event_{i}" for i in range(7)]
+
+
+@pytest.mark.asyncio
+async def test_async_mode_publishes_after_commit(db_session, monkeypatch):
+    monkeypatch.setattr(app_settings, "activity_log_mode", "async")
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    await activity_writer.start(test_session_maker)
+    try:
+        deal_service = DealService(db_session)
+        deal = await deal_service.create_deal(org.id, user.id, contact.id, "test deal")
+        await deal_service.update_deal(org.id, deal.id, user.id, stage="proposal")
+    finally:
+        await activity_writer.stop()
+    result = await db_session.execute(
+        select(Activity.type).where(Activity.deal_id == deal.id).order_by(Activity.created_at)
+    )
+    assert list(result.scalars()) == ["deal_created", "deal_stage_changed"]
+
+
+@pytest.mark.asyncio
+async def test_writer_invalidates_analytics_for_stage_changes(db_session):
+    writer = ActivityWriter(batch_size=10, flush_interval_ms=1000, max_queue_size=100)
+    await writer.start(test_session_maker)
+    staged, other, user_id = uuid4(), uuid4(), uuid4()
+    await writer.submit([
+        {"id": uuid4(), "organization_id": staged, "user_id": user_id, "type": "deal_stage_changed",
+         "from_stage": "qualification", "to_stage": "proposal"},
+        {"id": uuid4(), "organization_id": other, "user_id": user_id, "type": "contact_created"}
+    ])
+    await writer.stop()
+    assert await analytics_cache.get_version(staged) == 1
+    assert await analytics_cache.get_version(other) == 0
+    assert await analytics_cache.get_version(other, "data") == 1
@@ -0,0 +1,66 @@
+import time
+import pytest
+
+from src.cache import LRUCache, MemoryCacheBackend, AnalyticsCache
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+from src.services.deal_service import DealService
+from src.services.analytics_service import AnalyticsService
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_cache_expires_entries():
+    cache = LRUCache(max_entries=10, ttl_seconds=0.01)
+    cache.set("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+
+
+@pytest.mark.asyncio
+async def test_analytics_cache_shared_backend_versioning():
+    shared = MemoryCacheBackend()
+    first = AnalyticsCache(LRUCache(), shared)
+    second = AnalyticsCache(LRUCache(), shared)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"total": len(calls)}
+
+    assert await first.get_or_compute("org", "summary", compute) == {"total": 1}
+    assert await second.get_or_compute("org", "summary", compute) == {"total": 1}
+    await second.invalidate("org")
+    assert await first.get_or_compute("org", "summary", compute) == {"total": 2}
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_deal_mutation_invalidates_summary(db_session):
+    user = await AuthService(db_session).register_user(
+        email="owner@example.com",
+        password="password123",
+        full_name="owner"
+    )
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    analytics_service = AnalyticsService(db_session)
+    deal_service = DealService(db_session)
+    deal = await deal_service.create_deal(org.id, user.id, contact.id, "test deal", 100.0)
+    summary = await analytics_service.get_deals_summary(org.id, user.id)
+    assert summary["total"] == 0
+    await deal_service.close_deal(org.id, deal.id, user.id)
+    summary = await analytics_service.get_deals_summary(org.id, user.id)
+    assert summary["total"] == 1
+    assert summary["total_value"] == 100.0
@@ -2,6 +2,7 @@ import pytest
 from uuid import uuid4
 
 from src.services.auth_service import AuthService
+from src.services.request_context import CurrentUser
 from src.models.user import User
 
 
@@ -76,3 +77,29 @@ async def test_decode_token():
     assert payload is not None
     assert payload["sub"] == user_id
 
+
+
+@pytest.mark.asyncio
+async def test_user_cache_invalidated_on_update(db_session):
+    auth_service = AuthService(db_session)
+    user = await auth_service.register_user(
+        email="test@example.com",
+        password="password123",
+        full_name="test user"
+    )
+    cached = await auth_service.get_user_cached(user.id)
+    assert cached == CurrentUser(id=user.id, email="test@example.com", full_name="test user")
+    assert await auth_service.get_user_cached(user.id) is cached
+    await auth_service.user_repo.update(user.id, full_name="renamed")
+    cached = await auth_service.get_user_cached(user.id)
+    assert cached.full_name == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_decode_token_cached():
+    auth_service = AuthService(None)
+    user_id = str(uuid4())
+    token = auth_service.create_access_token(data={"sub": user_id})
+    assert auth_service.decode_token_cached(token)["sub"] == user_id
+    assert auth_service.decode_token_cached(token)["sub"] == user_id
+    assert auth_service.decode_token_cached("invalid") is None
@@ -0,0 +1,28 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update
+
+from src.models.contact_import_job import ContactImportJob
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_import_service import ImportJob, fail_stale_jobs, register_job
+from test.conftest import test_session_maker
+
+
+@pytest.mark.asyncio
+async def test_fail_stale_jobs_only_reaps_abandoned_jobs(db_session):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    stale = ImportJob(organization_id=org.id, user_id=user.id, format="csv")
+    fresh = ImportJob(organization_id=org.id, user_id=user.id, format="csv", status="running")
+    await register_job(db_session, stale)
+    await register_job(db_session, fresh)
+    await db_session.execute(
+        update(ContactImportJob)
+        .where(ContactImportJob.id == stale.id)
+        .values(updated_at=datetime.now(timezone.utc) - timedelta(hours=1))
+    )
+    await db_session.commit()
+    assert await fail_stale_jobs(test_session_maker, stale_after_seconds=600) == 1
+    result = await db_session.execute(select(ContactImportJob.id, ContactImportJob.status))
+    assert dict(result.all()) == {stale.id: "failed", fresh.id: "running"}
@@ -0,0 +1,51 @@
+import pytest
+from uuid import uuid4
+
+from src.search import OrganizationSearchIndex, contact_search_index
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+
+
+def test_search_ranks_word_prefix_above_substring():
+    index = OrganizationSearchIndex()
+    prefix_id, substring_id = uuid4(), uuid4()
+    index.add(prefix_id, "Mark Lee", ["Mark Lee", None, None, "Initech"])
+    index.add(substring_id, "Anne Demark", ["Anne Demark", "anne@example.com", None, None])
+    assert index.search("mar", 10) == [prefix_id, substring_id]
+    assert index.search("ma", 10) == [prefix_id]
+    index.remove(prefix_id)
+    assert index.search("mar", 10) == [substring_id]
+    assert "  m" not in index.postings
+
+
+def test_search_large_index_returns_exact_matches():
+    index = OrganizationSearchIndex()
+    ids = {}
+    for i in range(50000):
+        ids[i] = uuid4()
+        index.add(ids[i], f"contact {i}", [f"contact {i}", f"user{i}@example.com", None, f"company {i % 100}"])
+    results = index.search("user4999", 20)
+    assert results == [ids[4999]] + [ids[i] for i in range(49990, 50000)]
+
+
+@pytest.mark.asyncio
+async def test_search_builds_organization_index_once(db_session, monkeypatch):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact_service = ContactService(db_session)
+    await contact_service.create_contact(org.id, user.id, "john doe")
+    contact_search_index.clear()
+    builds = []
+    build = contact_search_index.build
+
+    def record(organization_id, rows):
+        builds.append(organization_id)
+        return build(organization_id, rows)
+
+    monkeypatch.setattr(contact_search_index, "build", record)
+    assert [contact.name for contact in await contact_service.search_contacts(org.id, user.id, "john")] == ["john doe"]
+    await contact_service.create_contact(org.id, user.id, "johnny cash")
+    names = [contact.name for contact in await contact_service.search_contacts(org.id, user.id, "john")]
+    assert names == ["john doe", "johnny cash"]
+    assert builds == [org.id]
@@ -0,0 +1,29 @@
+import asyncio
+import pytest
+
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.task_service import TaskService
+from src.services.dashboard_service import DashboardService
+from src.services.request_context import CurrentUser, RequestContext
+from src.repositories.organization_member_repository import OrganizationMemberRepository
+from test.conftest import test_session_maker
+
+
+@pytest.mark.asyncio
+async def test_dashboard_returns_partial_results_on_timeout(db_session, monkeypatch):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    await TaskService(db_session).create_task(org.id, user.id, "call", assigned_to_id=user.id)
+    member = await OrganizationMemberRepository(db_session).get_by_org_and_user(org.id, user.id)
+
+    async def slow(self, session, limit):
+        await asyncio.sleep(1)
+
+    monkeypatch.setattr(DashboardService, "_load_activities", slow)
+    dashboard = await DashboardService(test_session_maker, RequestContext(CurrentUser.from_model(user), member), timeout_ms=100).get_dashboard()
+    assert dashboard["timed_out"] == ["activities"]
+    assert dashboard["activities"] is None
+    assert [task.title for task in dashboard["tasks"]] == ["call"]
+    assert dashboard["deals"] == []
+    assert dashboard["summary"]["total"] == 0
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.database import InstrumentedQueuePool, get_pool_stats
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_reports_checkouts(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1
+    )
+    async with engine.connect() as first:
+        async with engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+            stats = get_pool_stats(engine.pool)
+            assert stats["checked_out"] == 2
+            assert stats["overflow"] == 1
+    stats = get_pool_stats(engine.pool)
+    assert stats["checked_out"] == 0
+    assert stats["checkouts"] == 2
+    assert stats["wait_time_max"] >= 0
+    await engine.dispose()
+
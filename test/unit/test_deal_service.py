@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import event, select
+
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+from src.services.deal_service import DealService
+from src.models.activity import Activity
+
+
+@pytest.fixture
+async def deal_setup(db_session):
+    user = await AuthService(db_session).register_user(
+        email="owner@example.com",
+        password="password123",
+        full_name="owner"
+    )
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    return user, org, contact
+
+
+@pytest.fixture
+def commits(db_session):
+    calls = []
+
+    def record(session):
+        calls.append(session)
+
+    event.listen(db_session.sync_session, "after_commit", record)
+    yield calls
+    event.remove(db_session.sync_session, "after_commit", record)
+
+
+@pytest.mark.asyncio
+async def test_create_deal_commits_once(db_session, deal_setup, commits):
+    user, org, contact = deal_setup
+    deal = await DealService(db_session).create_deal(org.id, user.id, contact.id, "test deal", 100.0)
+    assert len(commits) == 1
+    assert deal.created_at is not None
+    result = await db_session.execute(select(Activity).where(Activity.deal_id == deal.id))
+    assert [activity.type for activity in result.scalars()] == ["deal_created"]
+
+
+@pytest.mark.asyncio
+async def test_update_deal_returns_updated_row(db_session, deal_setup, commits):
+    user, org, contact = deal_setup
+    deal_service = DealService(db_session)
+    deal = await deal_service.create_deal(org.id, user.id, contact.id, "test deal")
+    updated = await deal_service.update_deal(org.id, deal.id, user.id, stage="proposal", title="renamed")
+    assert updated.stage == "proposal"
+    assert updated.title == "renamed"
+    assert len(commits) == 2
+    closed = await deal_service.close_deal(org.id, deal.id, user.id)
+    assert closed.status == "closed"
+    assert closed.closed_at is not None
+    assert len(commits) == 3
+
+
+@pytest.mark.asyncio
+async def test_update_deals_batches_in_one_commit(db_session, deal_setup, commits):
+    user, org, contact = deal_setup
+    deal_service = DealService(db_session)
+    deals = [await deal_service.create_deal(org.id, user.id, contact.id, f"deal {i}", 10.0) for i in range(3)]
+    await deal_service.update_deal(org.id, deals[0].id, user.id, stage="proposal")
+    commits.clear()
+    updated = await deal_service.update_deals(org.id, [deal.id for deal in deals], user.id, stage="proposal")
+    assert len(commits) == 1
+    assert sorted(deal.stage for deal in updated) == ["proposal"] * 3
+    result = await db_session.execute(
+        select(Activity.from_stage).where(Activity.type == "deal_stage_changed").order_by(Activity.created_at)
+    )
+    assert list(result.scalars()) == ["new", "new", "new"]
+    funnel = {stat["stage"]: stat["count"] for stat in await deal_service.deal_stat_repo.get_stage_stats(org.id)}
+    assert funnel == {"proposal": 3}
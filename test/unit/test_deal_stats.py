@@ -0,0 +1,47 @@
+import pytest
+
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+from src.services.deal_service import DealService
+from src.repositories.deal_stat_repository import DealStatRepository
+
+
+def by_key(stats):
+    return sorted((row["stage"], row["status"], row["count"], row["valued_count"], row["total_value"]) for row in stats)
+
+
+@pytest.mark.asyncio
+async def test_deal_stats_follow_deal_changes(db_session):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    deal_service = DealService(db_session)
+    first = await deal_service.create_deal(org.id, user.id, contact.id, "first", 100.0)
+    second = await deal_service.create_deal(org.id, user.id, contact.id, "second", 250.5, stage="proposal")
+    third = await deal_service.create_deal(org.id, user.id, contact.id, "third")
+    await deal_service.update_deal(org.id, first.id, user.id, stage="proposal", value=300.0)
+    await deal_service.update_deal(org.id, third.id, user.id, title="renamed")
+    await deal_service.close_deal(org.id, second.id, user.id)
+    await deal_service.delete_deal(org.id, third.id, user.id)
+    stat_repo = DealStatRepository(db_session)
+    stats = by_key(await stat_repo.get_stage_stats(org.id))
+    assert stats == [("proposal", "closed", 1, 1, 250.5), ("proposal", "open", 1, 1, 300.0)]
+    await stat_repo.rebuild(org.id)
+    await db_session.commit()
+    assert by_key(await stat_repo.get_stage_stats(org.id)) == stats
+
+
+@pytest.mark.asyncio
+async def test_full_rebuild_invalidates_every_organization(db_session, monkeypatch):
+    from src.cache import analytics_cache
+    from src.commands import rebuild_deal_stats
+    from test.conftest import test_session_maker
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    await DealService(db_session).create_deal(org.id, user.id, contact.id, "deal", 100.0)
+    version = await analytics_cache.get_version(org.id)
+    monkeypatch.setattr(rebuild_deal_stats, "async_session_maker", test_session_maker)
+    await rebuild_deal_stats.rebuild_deal_stats()
+    assert await analytics_cache.get_version(org.id) == version + 1
@@ -0,0 +1,25 @@
+from src.database import QueryCounter
+from src.metrics import Counter, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(Histogram("latency_seconds", "latency", ("route",), buckets=(0.1, 1.0)))
+    counter = registry.register(Counter("hits_total", "hits"))
+    histogram.observe(0.05, ("/a",))
+    histogram.observe(0.1, ("/a",))
+    histogram.observe(5, ("/a",))
+    counter.inc()
+    lines = registry.render().splitlines()
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="1.0"} 2' in lines
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_count{route="/a"} 3' in lines
+    assert "# TYPE hits_total counter" in lines
+    assert "hits_total 1" in lines
+
+
+def test_query_counter_reports_repeated_statements():
+    counter = QueryCounter()
+    counter.statements = {"SELECT users": 1, "SELECT contacts WHERE id = ?": 12}
+    assert counter.repeated(10) == [("SELECT contacts WHERE id = ?", 12)]
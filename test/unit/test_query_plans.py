@@ -0,0 +1,63 @@
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+from sqlalchemy import event
+
+from src.repositories.contact_repository import ContactRepository
+from src.repositories.deal_repository import DealRepository
+from src.repositories.task_repository import TaskRepository
+from src.repositories.activity_repository import ActivityRepository
+from src.repositories.organization_member_repository import OrganizationMemberRepository
+from src.repositories.analytics_repository import AnalyticsRepository
+from test.conftest import test_engine
+
+
+async def explain(db_session, call):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await call
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+    conn = await db_session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plans.extend(row[-1] for row in result)
+    return plans
+
+
+@pytest.mark.parametrize("call", [
+    lambda s, org, user: ContactRepository(s).get_by_organization(org),
+    lambda s, org, user: DealRepository(s).get_by_organization(org),
+    lambda s, org, user: DealRepository(s).get_by_stage(org, "new"),
+    lambda s, org, user: DealRepository(s).get_by_organization(org, filters={"status__in": ["won", "lost"]}),
+    lambda s, org, user: DealRepository(s).get_by_organization(org, filters={"contact_id": user}, sort="-value"),
+    lambda s, org, user: TaskRepository(s).get_by_organization(org),
+    lambda s, org, user: TaskRepository(s).get_by_user(org, user),
+    lambda s, org, user: TaskRepository(s).get_by_organization(org, filters={"status": "pending"}, sort="due_date"),
+    lambda s, org, user: TaskRepository(s).get_by_organization(org, filters={"deal_id": user}),
+    lambda s, org, user: TaskRepository(s).get_open_by_due_date(org, due_before=datetime(2024, 1, 1)),
+    lambda s, org, user: TaskRepository(s).count_overdue(org, datetime(2024, 1, 1)),
+    lambda s, org, user: ContactRepository(s).get_by_organization(org, filters={"company": "acme"}, sort="name"),
+    lambda s, org, user: ActivityRepository(s).get_by_organization(org, filters={"type__in": ["call"]}),
+    lambda s, org, user: ActivityRepository(s).get_by_organization(org),
+    lambda s, org, user: ActivityRepository(s).get_by_deal(org, uuid4()),
+    lambda s, org, user: AnalyticsRepository(s).get_series(org, "deals_created", "week", date(2024, 1, 1), date(2024, 4, 1)),
+    lambda s, org, user: AnalyticsRepository(s).get_series(org, "revenue_won", "month", date(2024, 1, 1), date(2024, 4, 1)),
+    lambda s, org, user: AnalyticsRepository(s).get_series(org, "tasks_completed", "day", date(2024, 1, 1), date(2024, 4, 1)),
+    lambda s, org, user: AnalyticsRepository(s).get_stage_transitions(org),
+    lambda s, org, user: OrganizationMemberRepository(s).get_by_user(user),
+    lambda s, org, user: OrganizationMemberRepository(s).get_by_org_and_user(org, user),
+])
+async def test_repository_queries_use_indexes(db_session, call):
+    plans = await explain(db_session, call(db_session, uuid4(), uuid4()))
+    assert plans
+    subqueries = {plan.split(" ", 1)[1] for plan in plans if plan.startswith(("CO-ROUTINE", "MATERIALIZE"))}
+    scans = [plan for plan in plans if plan.startswith("SCAN") and plan[5:] not in subqueries]
+    assert not scans, plans
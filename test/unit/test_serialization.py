@@ -0,0 +1,10 @@
+import json
+import pytest
+
+from benchmarks.serialization import LIST_ENDPOINTS, default_path, fast_path, make_rows
+
+
+@pytest.mark.parametrize("endpoint,schema,model", LIST_ENDPOINTS)
+async def test_fast_path_matches_default_serialization(endpoint, schema, model):
+    rows = make_rows(model, 3)
+    assert json.loads(await fast_path(schema, rows)) == json.loads(await default_path(schema, rows))
@@ -0,0 +1,74 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select
+
+from src.models.activity import Activity
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.task_service import TaskService
+from src.services.task_reminder import OverdueTaskScanner
+from test.conftest import test_session_maker
+
+
+@pytest.fixture
+async def org_setup(db_session):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    return user, org
+
+
+async def create_tasks(db_session, org, user):
+    now = datetime.now(timezone.utc)
+    task_service = TaskService(db_session)
+    tasks = {}
+    for title, due_in in [("late", -2), ("later", -1), ("soon", 2), ("far", 30), ("undated", None)]:
+        due_date = now + timedelta(days=due_in) if due_in is not None else None
+        tasks[title] = await task_service.create_task(
+            org.id, user.id, title, assigned_to_id=user.id, due_date=due_date
+        )
+    await task_service.complete_task(org.id, tasks["later"].id, user.id)
+    return tasks
+
+
+@pytest.mark.asyncio
+async def test_overdue_and_due_soon_queries(db_session, org_setup):
+    user, org = org_setup
+    await create_tasks(db_session, org, user)
+    task_service = TaskService(db_session)
+    overdue = await task_service.list_overdue_tasks(org.id, user.id, mine=True)
+    assert [task.title for task in overdue] == ["late"]
+    due_soon = await task_service.list_due_soon_tasks(org.id, user.id, days=7)
+    assert [task.title for task in due_soon] == ["soon"]
+    assert await task_service.count_overdue_tasks(org.id, user.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_scanner_emits_overdue_activity_once(db_session, org_setup):
+    user, org = org_setup
+    tasks = await create_tasks(db_session, org, user)
+    scanner = OverdueTaskScanner(interval_seconds=60, batch_size=1)
+    scanner.session_maker = test_session_maker
+    assert await scanner.scan() == 1
+    assert await scanner.scan() == 0
+    result = await db_session.execute(select(Activity.task_id).where(Activity.type == "task_overdue"))
+    assert list(result.scalars()) == [tasks["late"].id]
+    await TaskService(db_session).update_task(
+        org.id, tasks["late"].id, user.id, due_date=datetime.now(timezone.utc) - timedelta(hours=1)
+    )
+    assert await scanner.scan() == 1
+
+
+@pytest.mark.asyncio
+async def test_scanner_claims_unassigned_overdue_tasks(db_session, org_setup):
+    user, org = org_setup
+    task = await TaskService(db_session).create_task(
+        org.id, user.id, "nobody's", due_date=datetime.now(timezone.utc) - timedelta(days=1)
+    )
+    scanner = OverdueTaskScanner(interval_seconds=60, batch_size=10)
+    scanner.session_maker = test_session_maker
+    assert await scanner.scan() == 1
+    assert await scanner.scan() == 0
+    await db_session.refresh(task)
+    assert task.overdue_notified_at is not None
+    result = await db_session.execute(select(Activity.id).where(Activity.type == "task_overdue"))
+    assert list(result.scalars()) == []
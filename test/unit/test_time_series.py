@@ -0,0 +1,90 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+
+from src.services.auth_service import AuthService
+from src.services.organization_service import OrganizationService
+from src.services.contact_service import ContactService
+from src.services.deal_service import DealService
+from src.services.task_service import TaskService
+from src.services.analytics_service import AnalyticsService
+from src.repositories.analytics_repository import AnalyticsRepository, series_buckets
+
+
+def test_series_buckets():
+    assert series_buckets(date(2024, 1, 30), date(2024, 3, 2), "month") == [
+        date(2024, 1, 1), date(2024, 2, 1), date(2024, 3, 1)
+    ]
+    assert series_buckets(date(2024, 1, 3), date(2024, 1, 15), "week") == [
+        date(2024, 1, 1), date(2024, 1, 8), date(2024, 1, 15)
+    ]
+
+
+@pytest.fixture
+async def org_setup(db_session):
+    user = await AuthService(db_session).register_user("owner@example.com", "password123", "owner")
+    org = await OrganizationService(db_session).create_organization("test org", user.id)
+    contact = await ContactService(db_session).create_contact(org.id, user.id, "john doe")
+    return user, org, contact
+
+
+@pytest.mark.asyncio
+async def test_time_series_counts_current_bucket(db_session, org_setup):
+    user, org, contact = org_setup
+    deal_service = DealService(db_session)
+    first = await deal_service.create_deal(org.id, user.id, contact.id, "first", 100.0)
+    await deal_service.create_deal(org.id, user.id, contact.id, "second", 50.0)
+    await deal_service.close_deal(org.id, first.id, user.id)
+    task_service = TaskService(db_session)
+    task = await task_service.create_task(org.id, user.id, "call")
+    await task_service.complete_task(org.id, task.id, user.id)
+    analytics_service = AnalyticsService(db_session)
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=2)
+    created = await analytics_service.get_time_series(org.id, user.id, "deals_created", "day", start, today)
+    assert [point["count"] for point in created["points"]] == [0, 0, 2]
+    revenue = await analytics_service.get_time_series(org.id, user.id, "revenue_won", "month", today, today)
+    assert revenue["points"] == [{"bucket": today.replace(day=1), "count": 1, "value": 100.0}]
+    completed = await analytics_service.get_time_series(org.id, user.id, "tasks_completed", "week", today, today)
+    assert completed["points"][0]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_time_series_only_recomputes_current_bucket(db_session, org_setup, monkeypatch):
+    user, org, contact = org_setup
+    calls = []
+    get_series = AnalyticsRepository.get_series
+
+    async def record(self, organization_id, name, granularity, start, end):
+        calls.append((start, end))
+        return await get_series(self, organization_id, name, granularity, start, end)
+
+    monkeypatch.setattr(AnalyticsRepository, "get_series", record)
+    analytics_service = AnalyticsService(db_session)
+    today = datetime.now(timezone.utc).date()
+    start = today - timedelta(days=5)
+    await analytics_service.get_time_series(org.id, user.id, "deals_created", "day", start, today)
+    await DealService(db_session).create_deal(org.id, user.id, contact.id, "new deal")
+    series = await analytics_service.get_time_series(org.id, user.id, "deals_created", "day", start, today)
+    assert calls == [(start, today + timedelta(days=1)), (today, today + timedelta(days=1))]
+    assert series["points"][-1]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stage_conversion_from_transitions(db_session, org_setup):
+    user, org, contact = org_setup
+    deal_service = DealService(db_session)
+    for title, stages in [("a", ["qualification", "proposal"]), ("b", ["qualification"]), ("c", [])]:
+        deal = await deal_service.create_deal(org.id, user.id, contact.id, title)
+        for stage in stages:
+            await deal_service.update_deal(org.id, deal.id, user.id, stage=stage)
+    conversion = await AnalyticsService(db_session).get_stage_conversion(org.id, user.id)
+    stages = {stage["stage"]: stage for stage in conversion["stages"]}
+    assert [stage["stage"] for stage in conversion["stages"]] == ["new", "qualification", "proposal"]
+    assert (stages["new"]["entered"], stages["new"]["exited"]) == (3, 2)
+    assert stages["new"]["conversions"][0]["to_stage"] == "qualification"
+    assert stages["new"]["conversions"][0]["rate"] == pytest.approx(2 / 3)
+    assert stages["new"]["median_seconds"] >= 0
+    assert stages["qualification"]["conversions"] == [
+        {"to_stage": "proposal", "count": 1, "rate": 0.5, "median_seconds": stages["qualification"]["median_seconds"]}
+    ]
+    assert stages["proposal"]["median_seconds"] is None